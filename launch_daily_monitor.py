@@ -7,7 +7,8 @@ import subprocess
 import sys
 
 # Change to project directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+os.chdir(PROJECT_DIR)
 
 # Run daily monitor script
 subprocess.run(['./daily-monitor.sh'])
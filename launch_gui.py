@@ -6,7 +6,8 @@ import os
 import sys
 
 # Change to project directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+os.chdir(PROJECT_DIR)
 
 # Import and run the GUI
 import stingray_detector_gui
@@ -6,53 +6,112 @@ Runs scans on schedule and when HackRF is detected
 
 import os
 import json
+import signal
+import threading
 import time
 import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 
-SCHEDULE_FILE = os.path.expanduser('~/Library/Application Support/EpiRay/schedule.json')
-LAST_RUN_FILE = os.path.expanduser('~/Library/Application Support/EpiRay/last_run.json')
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import usb.core
+except ImportError:
+    usb = None
+
+# HackRF One USB vendor/product IDs
+HACKRF_VID = 0x1d50
+HACKRF_PID = 0x6089
+
+# Directory holding this script and the shell tooling it launches
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CONFIG_DIR = os.path.expanduser('~/Library/Application Support/EpiRay')
+SCHEDULE_FILE = os.path.join(CONFIG_DIR, 'schedule.json')
+LAST_RUN_FILE = os.path.join(CONFIG_DIR, 'last_run.json')
 
 def ensure_dirs():
     """Ensure config directories exist"""
-    os.makedirs(os.path.dirname(SCHEDULE_FILE), exist_ok=True)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+
+# In-process caches so check_and_run cycles don't re-read unchanged JSON
+_schedule_cache = {'mtime': None, 'data': None}
+_last_run_cache = None
 
 def load_schedule():
-    """Load schedule configuration"""
+    """Load schedule configuration (cached until the file changes on disk)"""
     ensure_dirs()
-    if os.path.exists(SCHEDULE_FILE):
-        with open(SCHEDULE_FILE, 'r') as f:
-            return json.load(f)
-    return {
-        'enabled': False,
-        'daily_time': '20:00',  # 8 PM default
-        'duration_minutes': 60,
-        'interval_seconds': 120
-    }
+    try:
+        mtime = os.stat(SCHEDULE_FILE).st_mtime_ns
+    except OSError:
+        return {
+            'enabled': False,
+            'daily_time': '20:00',  # 8 PM default
+            'duration_minutes': 60,
+            'interval_seconds': 120
+        }
+    if _schedule_cache['mtime'] != mtime:
+        with open(SCHEDULE_FILE, 'rb') as f:
+            raw = f.read()
+        _schedule_cache['data'] = orjson.loads(raw) if orjson else json.loads(raw)
+        _schedule_cache['mtime'] = mtime
+    return _schedule_cache['data']
 
 def save_schedule(schedule):
     """Save schedule configuration"""
     ensure_dirs()
-    with open(SCHEDULE_FILE, 'w') as f:
-        json.dump(schedule, f, indent=2)
+    if orjson:
+        with open(SCHEDULE_FILE, 'wb') as f:
+            f.write(orjson.dumps(schedule, option=orjson.OPT_INDENT_2))
+    else:
+        with open(SCHEDULE_FILE, 'w') as f:
+            json.dump(schedule, f, indent=2)
 
 def load_last_run():
     """Load last run timestamp"""
-    if os.path.exists(LAST_RUN_FILE):
+    global _last_run_cache
+    if _last_run_cache is None and os.path.exists(LAST_RUN_FILE):
         with open(LAST_RUN_FILE, 'r') as f:
-            data = json.load(f)
-            return datetime.fromisoformat(data['timestamp'])
-    return None
+            raw = f.read().strip()
+        try:
+            # Raw ISO timestamp; no JSON wrapper to parse
+            _last_run_cache = datetime.fromisoformat(raw)
+        except ValueError:
+            # Legacy {"timestamp": ...} files from older versions
+            try:
+                _last_run_cache = datetime.fromisoformat(json.loads(raw)['timestamp'])
+            except (ValueError, KeyError):
+                _last_run_cache = None
+    return _last_run_cache
 
 def save_last_run():
     """Save current timestamp as last run"""
+    global _last_run_cache
     ensure_dirs()
+    _last_run_cache = datetime.now()
     with open(LAST_RUN_FILE, 'w') as f:
-        json.dump({'timestamp': datetime.now().isoformat()}, f)
+        f.write(_last_run_cache.isoformat())
 
 def is_hackrf_available():
     """Check if HackRF is connected and not in use"""
+    # Presence check straight from the USB device table — no fork, no
+    # firmware handshake. Falls back to hackrf_info if PyUSB is missing.
+    if usb is not None:
+        try:
+            return usb.core.find(idVendor=HACKRF_VID, idProduct=HACKRF_PID) is not None
+        except (usb.core.USBError, usb.core.NoBackendError):
+            # NoBackendError means pyusb is installed but libusb isn't;
+            # fall through to hackrf_info like any other probe failure
+            pass
     try:
         result = subprocess.run(
             ['hackrf_info'],
@@ -63,14 +122,43 @@ def is_hackrf_available():
     except:
         return False
 
+def wait_for_hackrf(timeout_seconds):
+    """Wait for a HackRF to appear, reacting within seconds of plug-in
+
+    Real IOKit plug notifications would need a pyobjc run loop; the USB
+    device-table lookup is cheap enough to check every few seconds instead.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        if is_hackrf_available():
+            return True
+        time.sleep(5)
+    return False
+
 def kill_hackrf_processes():
     """Kill any running HackRF processes"""
-    try:
-        subprocess.run(['killall', 'hackrf_sweep'], stderr=subprocess.DEVNULL)
-        subprocess.run(['killall', 'hackrf_info'], stderr=subprocess.DEVNULL)
-        time.sleep(1)
-    except:
-        pass
+    if psutil is None:
+        # Fallback: shell out when psutil isn't installed
+        try:
+            subprocess.run(['killall', 'hackrf_sweep'], stderr=subprocess.DEVNULL)
+            subprocess.run(['killall', 'hackrf_info'], stderr=subprocess.DEVNULL)
+            time.sleep(1)
+        except:
+            pass
+        return
+
+    # One in-process scan instead of two killall forks; waiting on the
+    # signalled processes replaces the fixed sleep
+    signalled = []
+    for proc in psutil.process_iter(['name']):
+        if proc.info['name'] in ('hackrf_sweep', 'hackrf_info'):
+            try:
+                proc.send_signal(signal.SIGTERM)
+                signalled.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    if signalled:
+        psutil.wait_procs(signalled, timeout=2)
 
 def run_monitoring(duration_minutes, interval_seconds):
     """Run monitoring scan"""
@@ -86,7 +174,7 @@ def run_monitoring(duration_minutes, interval_seconds):
     try:
         subprocess.run(
             ['./track-movement.sh', str(duration_minutes), str(interval_seconds)],
-            cwd=os.path.dirname(os.path.abspath(__file__))
+            cwd=SCRIPT_DIR
         )
         save_last_run()
         print("Monitoring complete!")
@@ -126,14 +214,46 @@ def check_and_run():
         else:
             print("HackRF not available, will retry...")
     
+def next_run_time(schedule):
+    """Datetime of the next scheduled run (today if still ahead, else tomorrow)"""
+    hour, minute = map(int, schedule['daily_time'].split(':'))
+    now = datetime.now()
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return run_at
+
+# Set by SIGHUP so a config edit can wake the daemon early
+_reload_event = threading.Event()
+
+def _handle_sighup(signum, frame):
+    _reload_event.set()
+
 def daemon_loop():
     """Main daemon loop"""
     print("Scheduler daemon started")
-    
+    signal.signal(signal.SIGHUP, _handle_sighup)
+
+    # Sleep until the next scheduled run instead of polling every minute.
+    # Waits are capped at an hour so edits to schedule.json are picked up
+    # even without a SIGHUP; send SIGHUP to apply a new schedule at once.
     while True:
         try:
+            schedule = load_schedule()
+            if schedule['enabled']:
+                sleep_s = (next_run_time(schedule) - datetime.now()).total_seconds()
+            else:
+                sleep_s = 3600
+            if _reload_event.wait(timeout=max(1.0, min(sleep_s, 3600))):
+                _reload_event.clear()
+                continue  # schedule changed, recompute the next run
+
+            # Retry inside the 5-minute window if the HackRF isn't ready yet,
+            # running as soon as the device shows up rather than a minute later
             check_and_run()
-            time.sleep(60)  # Check every minute
+            while should_run_now(schedule):
+                if wait_for_hackrf(60):
+                    check_and_run()
         except KeyboardInterrupt:
             print("\nScheduler stopped")
             break
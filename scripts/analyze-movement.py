@@ -5,87 +5,80 @@ Analyze signal movement over time to determine if source is mobile
 
 import sys
 import os
-import csv
 import glob
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import numpy as np
+
+from sweep_parser import load_bins, nearest_bin_indices
+
+# Key frequencies to track
+KEY_FREQS = np.array([851e6, 760e6, 761e6, 762e6, 763e6, 764e6, 765e6, 766e6])
+
+def parse_one_scan(scan_file):
+    """Parse a single scan into its timeline entry (picklable for workers)"""
+    # Extract timestamp from filename (scan_YYYYMMDD_HHMMSS.csv); fixed
+    # slices skip strptime's per-call format parsing
+    basename = os.path.basename(scan_file)
+    ts = basename.replace('scan_', '').replace('.csv', '')
+    try:
+        timestamp = datetime(int(ts[0:4]), int(ts[4:6]), int(ts[6:8]),
+                             int(ts[9:11]), int(ts[11:13]), int(ts[13:15]))
+    except (ValueError, IndexError):
+        timestamp = None
+
+    # Load scan data
+    freqs, freq_avg = load_bins(scan_file)
+
+    # Extract key frequencies
+    scan_data = {'timestamp': timestamp, 'file': basename}
+    if len(freqs) > 0:
+        for key_freq, closest_idx in zip(KEY_FREQS, nearest_bin_indices(freqs, KEY_FREQS)):
+            if abs(freqs[closest_idx] - key_freq) < 1e6:  # Within 1 MHz
+                scan_data[f"{key_freq/1e6:.0f}"] = freq_avg[closest_idx]
+
+    return scan_data
+
 def analyze_movement(session_dir):
     """Analyze all scans in a session to detect movement"""
-    
+
     print(f"\n=== Movement Analysis ===")
     print(f"Session: {session_dir}\n")
-    
+
     # Find all scan files
     scan_files = sorted(glob.glob(f"{session_dir}/scan_*.csv"))
-    
+
     if len(scan_files) < 2:
         print("❌ Need at least 2 scans to analyze movement")
         return
-    
+
     print(f"Analyzing {len(scan_files)} scans...\n")
-    
-    # Key frequencies to track
-    key_freqs = [851e6, 760e6, 761e6, 762e6, 763e6, 764e6, 765e6, 766e6]
-    
-    # Track power over time for each frequency
-    timeline = []
-    
-    for scan_file in scan_files:
-        # Extract timestamp from filename
-        basename = os.path.basename(scan_file)
-        timestamp_str = basename.replace('scan_', '').replace('.csv', '')
-        try:
-            timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-        except:
-            timestamp = None
-        
-        # Load scan data
-        freq_data = defaultdict(list)
-        
-        with open(scan_file, 'r') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) < 6:
-                    continue
-                try:
-                    hz_low = int(row[2])
-                    hz_bin_width = float(row[4])
-                    power_readings = [float(x) for x in row[6:] if x]
-                    
-                    for idx, power in enumerate(power_readings):
-                        freq = hz_low + (idx * hz_bin_width)
-                        freq_data[freq].append(power)
-                except:
-                    continue
-        
-        # Average power for each frequency
-        freq_avg = {f: sum(p)/len(p) for f, p in freq_data.items()}
-        
-        # Extract key frequencies
-        scan_data = {'timestamp': timestamp, 'file': basename}
-        for key_freq in key_freqs:
-            closest = min(freq_avg.keys(), key=lambda x: abs(x - key_freq))
-            if abs(closest - key_freq) < 1e6:  # Within 1 MHz
-                scan_data[f"{key_freq/1e6:.0f}"] = freq_avg[closest]
-        
-        timeline.append(scan_data)
-    
-    # Display timeline
-    print("📊 Signal Strength Timeline:\n")
-    print(f"{'Time':<12} {'851 MHz':<12} {'760 MHz':<12} {'763 MHz':<12} {'766 MHz':<12}")
-    print("-" * 60)
-    
+
+    # Track power over time for each frequency.
+    # Parsing is per-file independent, so farm long sessions out to one
+    # worker per core; short sessions stay serial to skip pool spin-up.
+    if len(scan_files) < 4:
+        timeline = [parse_one_scan(f) for f in scan_files]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            timeline = list(executor.map(parse_one_scan, scan_files, chunksize=4))
+
+    # Display timeline in one buffered write instead of a print per scan
+    lines = ["📊 Signal Strength Timeline:\n",
+             f"{'Time':<12} {'851 MHz':<12} {'760 MHz':<12} {'763 MHz':<12} {'766 MHz':<12}",
+             "-" * 60]
+
     for scan in timeline:
         time_str = scan['timestamp'].strftime('%H:%M:%S') if scan['timestamp'] else 'Unknown'
         s851 = f"{scan.get('851', 0):.2f}" if '851' in scan else "N/A"
         s760 = f"{scan.get('760', 0):.2f}" if '760' in scan else "N/A"
         s763 = f"{scan.get('763', 0):.2f}" if '763' in scan else "N/A"
         s766 = f"{scan.get('766', 0):.2f}" if '766' in scan else "N/A"
-        
-        print(f"{time_str:<12} {s851:<12} {s760:<12} {s763:<12} {s766:<12}")
-    
-    print()
+
+        lines.append(f"{time_str:<12} {s851:<12} {s760:<12} {s763:<12} {s766:<12}")
+
+    sys.stdout.write("\n".join(lines) + "\n\n")
     
     # Analyze trends
     print("🔍 Movement Analysis:\n")
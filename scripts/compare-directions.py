@@ -5,40 +5,25 @@ Compare directional scans to determine signal source location
 
 import sys
 import os
-import csv
-import glob
-from collections import defaultdict
+import numpy as np
+
+from sweep_parser import load_bins, nearest_bin_indices
 
 def load_scan(filename):
     """Load scan and return average power for key frequencies"""
-    freq_data = defaultdict(list)
-    
-    with open(filename, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) < 6:
-                continue
-            try:
-                hz_low = int(row[2])
-                hz_bin_width = float(row[4])
-                power_readings = [float(x) for x in row[6:] if x]
-                
-                for idx, power in enumerate(power_readings):
-                    freq = hz_low + (idx * hz_bin_width)
-                    freq_data[freq].append(power)
-            except:
-                continue
-    
+    freqs, means = load_bins(filename)
+
     # Average for key frequencies
-    key_freqs = [851e6, 760e6, 763e6, 766e6]
+    key_freqs = np.array([851e6, 760e6, 763e6, 766e6])
     results = {}
-    
-    for key_freq in key_freqs:
-        closest = min(freq_data.keys(), key=lambda x: abs(x - key_freq))
-        if abs(closest - key_freq) < 1e6:
-            powers = freq_data[closest]
-            results[f"{key_freq/1e6:.0f}"] = sum(powers) / len(powers)
-    
+
+    if len(freqs) == 0:
+        return results
+
+    for key_freq, closest_idx in zip(key_freqs, nearest_bin_indices(freqs, key_freqs)):
+        if abs(freqs[closest_idx] - key_freq) < 1e6:
+            results[f"{key_freq/1e6:.0f}"] = means[closest_idx]
+
     return results
 
 def compare_directions(directory):
@@ -46,15 +31,26 @@ def compare_directions(directory):
     
     print("\n=== Directional Scan Comparison ===\n")
     
-    # Find all directional scans
+    # Find all directional scans with one directory pass; DirEntry.stat
+    # caches the ctime, so picking the latest file needs no extra stat calls
     directions = ['north', 'south', 'east', 'west', 'southwest', 'northeast', 'up', 'down']
+    latest_by_direction = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.csv') or not entry.is_file():
+                continue
+            direction = entry.name.split('_', 1)[0]
+            if direction not in directions:
+                continue
+            ctime = entry.stat().st_ctime
+            best = latest_by_direction.get(direction)
+            if best is None or ctime > best[0]:
+                latest_by_direction[direction] = (ctime, entry.path)
+
     results = {}
-    
     for direction in directions:
-        files = glob.glob(f"{directory}/{direction}_*.csv")
-        if files:
-            # Use most recent
-            latest = max(files, key=os.path.getctime)
+        if direction in latest_by_direction:
+            latest = latest_by_direction[direction][1]
             results[direction] = load_scan(latest)
             print(f"✅ Loaded {direction}: {os.path.basename(latest)}")
         else:
@@ -64,23 +60,24 @@ def compare_directions(directory):
         print("\n❌ Need at least 2 directional scans to compare")
         return
     
-    print("\n📊 Signal Strength by Direction:\n")
-    print(f"{'Direction':<12} {'851 MHz':<12} {'760 MHz':<12} {'763 MHz':<12} {'766 MHz':<12} {'Average':<12}")
-    print("-" * 80)
-    
+    # Emit the table in one buffered write instead of a print per direction
+    lines = ["\n📊 Signal Strength by Direction:\n",
+             f"{'Direction':<12} {'851 MHz':<12} {'760 MHz':<12} {'763 MHz':<12} {'766 MHz':<12} {'Average':<12}",
+             "-" * 80]
+
     averages = {}
     for direction, powers in results.items():
         avg = sum(powers.values()) / len(powers) if powers else 0
         averages[direction] = avg
-        
+
         s851 = f"{powers.get('851', 0):.2f}" if '851' in powers else "N/A"
         s760 = f"{powers.get('760', 0):.2f}" if '760' in powers else "N/A"
         s763 = f"{powers.get('763', 0):.2f}" if '763' in powers else "N/A"
         s766 = f"{powers.get('766', 0):.2f}" if '766' in powers else "N/A"
-        
-        print(f"{direction.upper():<12} {s851:<12} {s760:<12} {s763:<12} {s766:<12} {avg:<12.2f}")
-    
-    print()
+
+        lines.append(f"{direction.upper():<12} {s851:<12} {s760:<12} {s763:<12} {s766:<12} {avg:<12.2f}")
+
+    sys.stdout.write("\n".join(lines) + "\n\n")
     
     # Find strongest direction
     if averages:
@@ -4,43 +4,24 @@ Compare two spectrum scans to detect changes (potential Stingray activity)
 """
 
 import sys
-import csv
-from collections import defaultdict
+import numpy as np
+
+from sweep_parser import load_bins
 
 def load_scan(filename):
-    """Load and process a scan file"""
-    freq_data = defaultdict(list)
-    
+    """Load a scan file and return sorted (freqs, means) NumPy arrays"""
     try:
-        with open(filename, 'r') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) < 6:
-                    continue
-                    
-                try:
-                    hz_low = int(row[2])
-                    hz_high = int(row[3])
-                    hz_bin_width = float(row[4])
-                    power_readings = [float(x) for x in row[6:] if x]
-                    
-                    for i, power in enumerate(power_readings):
-                        freq = hz_low + (i * hz_bin_width)
-                        freq_data[freq].append(power)
-                        
-                except (ValueError, IndexError):
-                    continue
-                    
+        return load_bins(filename)
     except FileNotFoundError:
         print(f"❌ File not found: {filename}")
         sys.exit(1)
-    
-    # Calculate average power for each frequency
-    freq_avg = {}
-    for freq, powers in freq_data.items():
-        freq_avg[freq] = sum(powers) / len(powers)
-    
-    return freq_avg
+
+def in_sorted(values, sorted_freqs):
+    """Membership mask for values against a sorted frequency array"""
+    idx = np.searchsorted(sorted_freqs, values)
+    found = idx < len(sorted_freqs)
+    found[found] = sorted_freqs[idx[found]] == values[found]
+    return found
 
 def compare_scans(baseline_file, current_file, threshold=-60):
     """Compare two scans and identify differences"""
@@ -51,37 +32,40 @@ def compare_scans(baseline_file, current_file, threshold=-60):
     print(f"Threshold: {threshold} dBm")
     print()
     
-    baseline = load_scan(baseline_file)
-    current = load_scan(current_file)
-    
+    baseline_freqs, baseline_avg = load_scan(baseline_file)
+    current_freqs, current_avg = load_scan(current_file)
+
     # Find strong signals in each
-    baseline_strong = {freq: power for freq, power in baseline.items() if power > threshold}
-    current_strong = {freq: power for freq, power in current.items() if power > threshold}
-    
+    baseline_mask = baseline_avg > threshold
+    current_mask = current_avg > threshold
+    baseline_strong_freqs = baseline_freqs[baseline_mask]
+    baseline_strong_powers = baseline_avg[baseline_mask]
+    current_strong_freqs = current_freqs[current_mask]
+    current_strong_powers = current_avg[current_mask]
+
     # Find new signals (in current but not baseline)
-    new_signals = []
-    for freq in current_strong:
-        if freq not in baseline_strong:
-            new_signals.append((freq, current_strong[freq]))
-    
+    # Strong-signal arrays stay sorted, so membership is a binary search
+    new_mask = ~in_sorted(current_strong_freqs, baseline_strong_freqs)
+    new_signals = list(zip(current_strong_freqs[new_mask], current_strong_powers[new_mask]))
+
     # Find disappeared signals (in baseline but not current)
-    disappeared_signals = []
-    for freq in baseline_strong:
-        if freq not in current_strong:
-            disappeared_signals.append((freq, baseline_strong[freq]))
-    
+    gone_mask = ~in_sorted(baseline_strong_freqs, current_strong_freqs)
+    disappeared_signals = list(zip(baseline_strong_freqs[gone_mask], baseline_strong_powers[gone_mask]))
+
     # Find changed signals (significant power difference)
-    changed_signals = []
-    for freq in baseline_strong:
-        if freq in current_strong:
-            power_diff = current_strong[freq] - baseline_strong[freq]
-            if abs(power_diff) > 5:  # 5 dBm threshold
-                changed_signals.append((freq, baseline_strong[freq], current_strong[freq], power_diff))
-    
+    common_freqs, baseline_idx, current_idx = np.intersect1d(
+        baseline_strong_freqs, current_strong_freqs, return_indices=True)
+    power_diffs = current_strong_powers[current_idx] - baseline_strong_powers[baseline_idx]
+    changed_mask = np.abs(power_diffs) > 5  # 5 dBm threshold
+    changed_signals = list(zip(common_freqs[changed_mask],
+                               baseline_strong_powers[baseline_idx][changed_mask],
+                               current_strong_powers[current_idx][changed_mask],
+                               power_diffs[changed_mask]))
+
     # Report findings
     print("📊 Summary:")
-    print(f"   Baseline strong signals: {len(baseline_strong)}")
-    print(f"   Current strong signals:  {len(current_strong)}")
+    print(f"   Baseline strong signals: {len(baseline_strong_freqs)}")
+    print(f"   Current strong signals:  {len(current_strong_freqs)}")
     print()
     
     if new_signals:
@@ -139,44 +123,53 @@ def compare_scans(baseline_file, current_file, threshold=-60):
         print("   ✅ NORMAL: No suspicious activity detected")
     print()
 
+# Cellular bands as (low MHz, high MHz, label), earlier entries win overlaps
+BAND_RANGES = [
+    (824, 849, "GSM-850 (downlink)"),
+    (869, 894, "GSM-850 (uplink)"),
+    (890, 915, "GSM-900 (downlink)"),
+    (925, 960, "GSM-900 (uplink)"),
+    (1710, 1785, "GSM-1800 (downlink)"),
+    (1805, 1880, "GSM-1800 (uplink)"),
+    (1850, 1910, "GSM-1900 (downlink)"),
+    (1930, 1990, "GSM-1900 (uplink)"),
+    (698, 716, "LTE Band 12/17 (uplink)"),
+    (728, 746, "LTE Band 12/17 (downlink)"),
+    (777, 787, "LTE Band 13 (uplink)"),
+    (746, 756, "LTE Band 13 (downlink)"),
+    (1710, 1755, "LTE Band 4 (uplink)"),
+    (2110, 2155, "LTE Band 4 (downlink)"),
+    (1850, 1910, "LTE Band 2 (uplink)"),
+    (1930, 1990, "LTE Band 2 (downlink)"),
+]
+
+def build_band_table(ranges, default="Other"):
+    """Flatten priority-ordered ranges into sorted disjoint lookup edges"""
+    def classify(mhz):
+        for low, high, label in ranges:
+            if low <= mhz <= high:
+                return label
+        return default
+
+    points = sorted({p for low, high, _ in ranges for p in (low, high)})
+    edges = [-np.inf]
+    labels = [default]
+    for i, point in enumerate(points):
+        # One slot for the boundary itself (ranges are closed on both ends),
+        # one for the stretch up to the next boundary
+        upper = points[i + 1] if i + 1 < len(points) else np.inf
+        edges.append(point)
+        labels.append(classify(point))
+        edges.append(np.nextafter(point, np.inf))
+        labels.append(classify((point + upper) / 2))
+    return np.array(edges), labels
+
+BAND_EDGES, BAND_LABELS = build_band_table(BAND_RANGES)
+
 def identify_band(freq_hz):
     """Identify cellular band from frequency"""
-    freq_mhz = freq_hz / 1e6
-    
-    if 824 <= freq_mhz <= 849:
-        return "GSM-850 (downlink)"
-    elif 869 <= freq_mhz <= 894:
-        return "GSM-850 (uplink)"
-    elif 890 <= freq_mhz <= 915:
-        return "GSM-900 (downlink)"
-    elif 925 <= freq_mhz <= 960:
-        return "GSM-900 (uplink)"
-    elif 1710 <= freq_mhz <= 1785:
-        return "GSM-1800 (downlink)"
-    elif 1805 <= freq_mhz <= 1880:
-        return "GSM-1800 (uplink)"
-    elif 1850 <= freq_mhz <= 1910:
-        return "GSM-1900 (downlink)"
-    elif 1930 <= freq_mhz <= 1990:
-        return "GSM-1900 (uplink)"
-    elif 698 <= freq_mhz <= 716:
-        return "LTE Band 12/17 (uplink)"
-    elif 728 <= freq_mhz <= 746:
-        return "LTE Band 12/17 (downlink)"
-    elif 777 <= freq_mhz <= 787:
-        return "LTE Band 13 (uplink)"
-    elif 746 <= freq_mhz <= 756:
-        return "LTE Band 13 (downlink)"
-    elif 1710 <= freq_mhz <= 1755:
-        return "LTE Band 4 (uplink)"
-    elif 2110 <= freq_mhz <= 2155:
-        return "LTE Band 4 (downlink)"
-    elif 1850 <= freq_mhz <= 1910:
-        return "LTE Band 2 (uplink)"
-    elif 1930 <= freq_mhz <= 1990:
-        return "LTE Band 2 (downlink)"
-    else:
-        return "Other"
+    idx = np.searchsorted(BAND_EDGES, freq_hz / 1e6, side='right') - 1
+    return BAND_LABELS[idx]
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
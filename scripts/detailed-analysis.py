@@ -3,150 +3,202 @@
 Detailed analysis of suspicious frequencies
 """
 
+import json
 import sys
-import csv
-from collections import defaultdict
-
-def detailed_analysis(scan_file, focus_freq_min=700, focus_freq_max=900):
-    """Analyze specific frequency range in detail"""
-    
-    print(f"\n=== Detailed Analysis: {scan_file} ===")
-    print(f"Focus range: {focus_freq_min}-{focus_freq_max} MHz\n")
-    
-    freq_data = defaultdict(list)
-    
-    # Read scan
-    with open(scan_file, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) < 6:
-                continue
-            try:
-                hz_low = int(row[2])
-                hz_high = int(row[3])
-                hz_bin_width = float(row[4])
-                power_readings = [float(x) for x in row[6:] if x]
-                
-                for i, power in enumerate(power_readings):
-                    freq = hz_low + (i * hz_bin_width)
-                    freq_data[freq].append(power)
-            except (ValueError, IndexError):
-                continue
-    
-    # Calculate averages
-    freq_avg = {}
-    for freq, powers in freq_data.items():
-        freq_avg[freq] = sum(powers) / len(powers)
-    
-    # Filter to focus range
-    focus_signals = []
-    for freq, power in freq_avg.items():
-        freq_mhz = freq / 1e6
-        if focus_freq_min <= freq_mhz <= focus_freq_max:
-            focus_signals.append((freq, power))
-    
-    focus_signals.sort(key=lambda x: x[1], reverse=True)
-    
-    print(f"📡 Top 50 Signals in {focus_freq_min}-{focus_freq_max} MHz:")
-    print(f"{'Frequency (MHz)':<20} {'Power (dBm)':<15} {'Band':<30} {'Notes'}")
-    print("-" * 100)
-    
-    for freq, power in focus_signals[:50]:
-        freq_mhz = freq / 1e6
-        band = identify_band(freq)
-        notes = get_notes(freq_mhz, power)
-        print(f"{freq_mhz:<20.3f} {power:<15.2f} {band:<30} {notes}")
-    
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from sweep_parser import load_bins
+
+def detailed_analysis(scan_file, focus_freq_min=700, focus_freq_max=900, as_json=False):
+    """Analyze specific frequency range in detail
+
+    With as_json the results go to stdout as machine-readable JSON and the
+    decorated report is skipped entirely.
+    """
+
+    if not as_json:
+        print(f"\n=== Detailed Analysis: {scan_file} ===")
+        print(f"Focus range: {focus_freq_min}-{focus_freq_max} MHz\n")
+
+    freqs, freq_avg = load_bins(scan_file)
+
+    # Filter to focus range with one vectorized mask
+    freqs_mhz = freqs / 1e6
+    focus_mask = (freqs_mhz >= focus_freq_min) & (freqs_mhz <= focus_freq_max)
+    focus_freqs = freqs[focus_mask]
+    focus_powers = freq_avg[focus_mask]
+
+    # Only the 50 strongest signals are ever reported: introselect the top k
+    # in O(N), then sort just those k — no full O(N log N) sort of every bin
+    k = min(50, len(focus_powers))
+    order = np.argpartition(-focus_powers, k - 1)[:k] if k else np.array([], dtype=np.intp)
+    order = order[np.argsort(-focus_powers[order], kind='stable')]
+    top_freqs = focus_freqs[order]
+    top_powers = focus_powers[order]
+    top_mhz = top_freqs / 1e6
+    focus_signals = list(zip(top_freqs, top_powers))
+
+    if as_json:
+        clusters = find_clusters(focus_signals)
+        payload = {
+            'scan_file': scan_file,
+            'focus_range_mhz': [focus_freq_min, focus_freq_max],
+            'freqs_mhz': top_mhz.tolist(),
+            'avg_dbm': top_powers.tolist(),
+            'clusters': [
+                {'center_mhz': float(center),
+                 'count': len(cluster_signals),
+                 'avg_power_dbm': float(sum(s[1] for s in cluster_signals) / len(cluster_signals)),
+                 'band': identify_band(cluster_signals[0][0])}
+                for center, cluster_signals in clusters
+            ],
+        }
+        if orjson:
+            sys.stdout.buffer.write(orjson.dumps(payload) + b"\n")
+        else:
+            sys.stdout.write(json.dumps(payload) + "\n")
+        return
+
+    # Emit the whole report in one buffered write instead of a print per row
+    lines = [f"📡 Top 50 Signals in {focus_freq_min}-{focus_freq_max} MHz:",
+             f"{'Frequency (MHz)':<20} {'Power (dBm)':<15} {'Band':<30} {'Notes'}",
+             "-" * 100]
+
+    # Classify the whole table at once: one searchsorted call for the bands,
+    # one set of boolean masks for the notes
+    band_idx = np.searchsorted(BAND_EDGES, top_mhz, side='right') - 1
+    notes_list = get_notes(top_mhz, top_powers)
+
+    for freq_mhz, power, idx, notes in zip(top_mhz, top_powers, band_idx, notes_list):
+        lines.append(f"{freq_mhz:<20.3f} {power:<15.2f} {BAND_LABELS[idx]:<30} {notes}")
+
     # Identify clusters
-    print(f"\n🔍 Signal Clusters:")
-    clusters = find_clusters(focus_signals[:50])
+    lines.append(f"\n🔍 Signal Clusters:")
+    clusters = find_clusters(focus_signals)
     for cluster_center, cluster_signals in clusters:
-        print(f"\n  Cluster around {cluster_center:.1f} MHz ({len(cluster_signals)} signals):")
+        lines.append(f"\n  Cluster around {cluster_center:.1f} MHz ({len(cluster_signals)} signals):")
         avg_power = sum(s[1] for s in cluster_signals) / len(cluster_signals)
-        print(f"    Average power: {avg_power:.2f} dBm")
-        print(f"    Range: {min(s[0]/1e6 for s in cluster_signals):.1f} - {max(s[0]/1e6 for s in cluster_signals):.1f} MHz")
-        print(f"    Band: {identify_band(cluster_signals[0][0])}")
+        lines.append(f"    Average power: {avg_power:.2f} dBm")
+        lines.append(f"    Range: {min(s[0]/1e6 for s in cluster_signals):.1f} - {max(s[0]/1e6 for s in cluster_signals):.1f} MHz")
+        lines.append(f"    Band: {identify_band(cluster_signals[0][0])}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def find_clusters(signals, threshold_mhz=5):
-    """Group nearby frequencies into clusters"""
+    """Group nearby frequencies into clusters
+
+    A cluster break is any adjacent pair more than threshold_mhz apart, so
+    the whole walk reduces to one vectorized diff over the frequency array
+    instead of a Python loop with per-step float arithmetic.
+    """
     if not signals:
         return []
-    
+
+    freqs = np.array([s[0] for s in signals])
+    breaks = np.flatnonzero(np.abs(np.diff(freqs)) / 1e6 > threshold_mhz) + 1
+
     clusters = []
-    current_cluster = [signals[0]]
-    
-    for i in range(1, len(signals)):
-        freq_diff = abs(signals[i][0] - current_cluster[-1][0]) / 1e6
-        if freq_diff <= threshold_mhz:
-            current_cluster.append(signals[i])
-        else:
-            if len(current_cluster) >= 3:
-                center = sum(s[0] for s in current_cluster) / len(current_cluster) / 1e6
-                clusters.append((center, current_cluster))
-            current_cluster = [signals[i]]
-    
-    if len(current_cluster) >= 3:
-        center = sum(s[0] for s in current_cluster) / len(current_cluster) / 1e6
-        clusters.append((center, current_cluster))
-    
+    for start, stop in zip(np.r_[0, breaks], np.r_[breaks, len(signals)]):
+        if stop - start >= 3:
+            center = freqs[start:stop].mean() / 1e6
+            clusters.append((center, signals[start:stop]))
+
     return clusters
 
-def get_notes(freq_mhz, power):
-    """Get notes about suspicious signals"""
-    notes = []
-    
+def get_notes(freqs_mhz, powers):
+    """Get notes about suspicious signals (one string per signal)
+
+    All the flag conditions evaluate as boolean masks over the whole table;
+    only the final string join runs per row.
+    """
     # Very strong signal
-    if power > -20:
-        notes.append("⚠️ VERY STRONG")
-    elif power > -30:
-        notes.append("Strong")
-    
+    very_strong = powers > -20
+    strong = (powers > -30) & ~very_strong
+
     # LTE Band 13 (public safety - used by FirstNet)
-    if 746 <= freq_mhz <= 756 or 777 <= freq_mhz <= 787:
-        notes.append("PUBLIC SAFETY BAND")
-    
+    public_safety = (((freqs_mhz >= 746) & (freqs_mhz <= 756)) |
+                     ((freqs_mhz >= 777) & (freqs_mhz <= 787)))
+
     # Check for unusual frequencies
-    if 758 <= freq_mhz <= 768:
-        notes.append("⚠️ Between LTE bands (unusual)")
-    
-    if 850 <= freq_mhz <= 853:
-        notes.append("⚠️ Edge of GSM-850 (check)")
-    
-    return " | ".join(notes) if notes else ""
+    between_lte = (freqs_mhz >= 758) & (freqs_mhz <= 768)
+    gsm_edge = (freqs_mhz >= 850) & (freqs_mhz <= 853)
+
+    all_notes = []
+    for i in range(len(freqs_mhz)):
+        notes = []
+        if very_strong[i]:
+            notes.append("⚠️ VERY STRONG")
+        elif strong[i]:
+            notes.append("Strong")
+        if public_safety[i]:
+            notes.append("PUBLIC SAFETY BAND")
+        if between_lte[i]:
+            notes.append("⚠️ Between LTE bands (unusual)")
+        if gsm_edge[i]:
+            notes.append("⚠️ Edge of GSM-850 (check)")
+        all_notes.append(" | ".join(notes))
+    return all_notes
+
+# Band ranges in chain order: earlier entries win where ranges overlap
+BAND_RANGES = [
+    (824, 849, "GSM-850 (downlink)"),
+    (869, 894, "GSM-850 (uplink)"),
+    (890, 915, "GSM-900 (downlink)"),
+    (925, 960, "GSM-900 (uplink)"),
+    (698, 716, "LTE Band 12/17 (uplink)"),
+    (728, 746, "LTE Band 12/17 (downlink)"),
+    (746, 756, "LTE Band 13 (downlink)"),
+    (777, 787, "LTE Band 13 (uplink)"),
+]
+
+def build_band_table(ranges, default="Other/Unknown"):
+    """Flatten priority-ordered ranges into sorted disjoint lookup edges"""
+    def classify(mhz):
+        for low, high, label in ranges:
+            if low <= mhz <= high:
+                return label
+        return default
+
+    points = sorted({p for low, high, _ in ranges for p in (low, high)})
+    edges = [-np.inf]
+    labels = [default]
+    for i, point in enumerate(points):
+        # One slot for the boundary itself (ranges are closed on both ends),
+        # one for the stretch up to the next boundary
+        upper = points[i + 1] if i + 1 < len(points) else np.inf
+        edges.append(point)
+        labels.append(classify(point))
+        edges.append(np.nextafter(point, np.inf))
+        labels.append(classify((point + upper) / 2))
+    return np.array(edges), labels
+
+BAND_EDGES, BAND_LABELS = build_band_table(BAND_RANGES)
 
 def identify_band(freq_hz):
     """Identify cellular band"""
-    freq_mhz = freq_hz / 1e6
-    
-    if 824 <= freq_mhz <= 849:
-        return "GSM-850 (downlink)"
-    elif 869 <= freq_mhz <= 894:
-        return "GSM-850 (uplink)"
-    elif 890 <= freq_mhz <= 915:
-        return "GSM-900 (downlink)"
-    elif 925 <= freq_mhz <= 960:
-        return "GSM-900 (uplink)"
-    elif 698 <= freq_mhz <= 716:
-        return "LTE Band 12/17 (uplink)"
-    elif 728 <= freq_mhz <= 746:
-        return "LTE Band 12/17 (downlink)"
-    elif 746 <= freq_mhz <= 756:
-        return "LTE Band 13 (downlink)"
-    elif 777 <= freq_mhz <= 787:
-        return "LTE Band 13 (uplink)"
-    else:
-        return "Other/Unknown"
+    idx = np.searchsorted(BAND_EDGES, freq_hz / 1e6, side='right') - 1
+    return BAND_LABELS[idx]
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 detailed-analysis.py <scan_file.csv> [freq_min] [freq_max]")
+    as_json = '--json' in sys.argv
+    args = [a for a in sys.argv[1:] if a != '--json']
+
+    if len(args) < 1:
+        print("Usage: python3 detailed-analysis.py <scan_file.csv> [freq_min] [freq_max] [--json]")
         print("\nExample:")
         print("  python3 detailed-analysis.py detection-logs/incidents/check_*.csv")
         print("  python3 detailed-analysis.py scan.csv 700 900")
+        print("  python3 detailed-analysis.py scan.csv --json | jq .clusters")
         sys.exit(1)
-    
-    scan_file = sys.argv[1]
-    freq_min = int(sys.argv[2]) if len(sys.argv) > 2 else 700
-    freq_max = int(sys.argv[3]) if len(sys.argv) > 3 else 900
-    
-    detailed_analysis(scan_file, freq_min, freq_max)
+
+    scan_file = args[0]
+    freq_min = int(args[1]) if len(args) > 1 else 700
+    freq_max = int(args[2]) if len(args) > 2 else 900
+
+    detailed_analysis(scan_file, freq_min, freq_max, as_json=as_json)
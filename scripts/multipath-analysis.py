@@ -4,67 +4,45 @@ Analyze multipath/reflection patterns to help locate signal source
 """
 
 import sys
-import csv
-from collections import defaultdict
-import math
+
+import numpy as np
+
+from sweep_parser import load_bin_stats, nearest_bin_indices
 
 def analyze_multipath(scan_file):
     """
     Analyze signal characteristics that indicate multipath/reflection
     """
-    
+
     print(f"\n=== Multipath/Reflection Analysis ===")
     print(f"Scan: {scan_file}\n")
-    
-    # Load scan data
-    freq_data = defaultdict(list)
-    
-    with open(scan_file, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) < 6:
-                continue
-            try:
-                hz_low = int(row[2])
-                hz_bin_width = float(row[4])
-                power_readings = [float(x) for x in row[6:] if x]
-                
-                for idx, power in enumerate(power_readings):
-                    freq = hz_low + (idx * hz_bin_width)
-                    freq_data[freq].append(power)
-            except:
-                continue
-    
-    # Calculate statistics for each frequency
-    freq_stats = {}
-    for freq, powers in freq_data.items():
-        freq_stats[freq] = {
-            'mean': sum(powers) / len(powers),
-            'min': min(powers),
-            'max': max(powers),
-            'variance': sum((p - sum(powers)/len(powers))**2 for p in powers) / len(powers),
-            'samples': len(powers)
-        }
-    
+
+    # Load per-bin statistics in one vectorized pass; the running-sums form
+    # gives mean/min/max/variance without keeping per-sample lists around
+    freqs, means, mins, maxs, variances, counts = load_bin_stats(scan_file)
+
+    if len(freqs) == 0:
+        print("❌ No scan data found")
+        return
+
     # Focus on suspicious frequencies
-    key_freqs = [851e6, 760e6, 761e6, 762e6, 763e6, 764e6, 765e6, 766e6]
-    
-    print("📡 Signal Characteristics (Multipath Indicators):\n")
-    print(f"{'Freq (MHz)':<12} {'Avg Power':<12} {'Variance':<12} {'Range':<12} {'Multipath?'}")
-    print("-" * 70)
-    
+    key_freqs = np.array([851e6, 760e6, 761e6, 762e6, 763e6, 764e6, 765e6, 766e6])
+
+    # Emit the table in one buffered write instead of a print per row
+    lines = ["📡 Signal Characteristics (Multipath Indicators):\n",
+             f"{'Freq (MHz)':<12} {'Avg Power':<12} {'Variance':<12} {'Range':<12} {'Multipath?'}",
+             "-" * 70]
+
     multipath_detected = []
-    
-    for key_freq in key_freqs:
-        # Find closest frequency
-        closest = min(freq_stats.keys(), key=lambda x: abs(x - key_freq))
+
+    for key_freq, closest_idx in zip(key_freqs, nearest_bin_indices(freqs, key_freqs)):
+        closest = freqs[closest_idx]
         if abs(closest - key_freq) > 1e6:
             continue
-        
-        stats = freq_stats[closest]
+
         freq_mhz = closest / 1e6
-        power_range = stats['max'] - stats['min']
-        variance = stats['variance']
+        power_range = maxs[closest_idx] - mins[closest_idx]
+        variance = variances[closest_idx]
         
         # High variance or wide range suggests multipath
         multipath_indicator = ""
@@ -79,22 +57,22 @@ def analyze_multipath(scan_file):
         else:
             multipath_indicator = "✅ Stable (direct line-of-sight)"
         
-        print(f"{freq_mhz:<12.1f} {stats['mean']:<12.2f} {variance:<12.2f} {power_range:<12.2f} {multipath_indicator}")
-    
-    print()
+        lines.append(f"{freq_mhz:<12.1f} {means[closest_idx]:<12.2f} {variance:<12.2f} {power_range:<12.2f} {multipath_indicator}")
+
+    sys.stdout.write("\n".join(lines) + "\n\n")
     
     # Analyze frequency-dependent fading
     print("🔍 Frequency-Dependent Fading Analysis:")
     print("(Different frequencies fade differently with multipath)\n")
     
     # Compare adjacent frequencies in the 760-766 cluster
-    cluster_freqs = [760e6, 761e6, 762e6, 763e6, 764e6, 765e6, 766e6]
+    cluster_freqs = np.array([760e6, 761e6, 762e6, 763e6, 764e6, 765e6, 766e6])
     cluster_powers = []
-    
-    for freq in cluster_freqs:
-        closest = min(freq_stats.keys(), key=lambda x: abs(x - freq))
+
+    for freq, closest_idx in zip(cluster_freqs, nearest_bin_indices(freqs, cluster_freqs)):
+        closest = freqs[closest_idx]
         if abs(closest - freq) < 1e6:
-            cluster_powers.append((closest/1e6, freq_stats[closest]['mean']))
+            cluster_powers.append((closest / 1e6, means[closest_idx]))
     
     if len(cluster_powers) > 1:
         # Look for power variations across adjacent frequencies
@@ -6,9 +6,19 @@ Uses PIL/Pillow for image manipulation
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import json
 
+@lru_cache(maxsize=None)
+def get_font(size):
+    """Load a font once per size; batch runs reuse the parsed face"""
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+    except:
+        return ImageFont.load_default()
+
 def annotate_photo(photo_path, output_path, measurements):
     """
     Add measurement annotations to a photo
@@ -24,26 +34,23 @@ def annotate_photo(photo_path, output_path, measurements):
     
     # Open image
     img = Image.open(photo_path)
-    draw = ImageDraw.Draw(img)
     
     # Get image dimensions
     width, height = img.size
     
-    # Try to load a nice font, fallback to default
-    try:
-        # Try different font sizes
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-        label_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-        data_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 35)
-    except:
-        title_font = ImageFont.load_default()
-        label_font = ImageFont.load_default()
-        data_font = ImageFont.load_default()
+    # Fonts come from the per-size cache instead of three truetype loads
+    title_font = get_font(60)
+    label_font = get_font(40)
+    data_font = get_font(35)
+    
+    # Every annotation lands on one full-frame RGBA overlay, composited
+    # onto the photo once at the end instead of a masked paste per box
+    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
     
     # Draw semi-transparent overlay at top
     overlay_height = 200
-    overlay = Image.new('RGBA', (width, overlay_height), (0, 0, 0, 180))
-    img.paste(overlay, (0, 0), overlay)
+    draw.rectangle([(0, 0), (width - 1, overlay_height - 1)], fill=(0, 0, 0, 180))
     
     # Draw title
     species = measurements.get('species', 'Unknown Stingray')
@@ -63,8 +70,7 @@ def annotate_photo(photo_path, output_path, measurements):
     
     # Draw info box at bottom
     info_height = 150
-    info_overlay = Image.new('RGBA', (width, info_height), (0, 0, 0, 180))
-    img.paste(info_overlay, (0, height - info_height), info_overlay)
+    draw.rectangle([(0, height - info_height), (width - 1, height - 1)], fill=(0, 0, 0, 180))
     
     # Draw additional info
     y_bottom = height - info_height + 20
@@ -123,8 +129,11 @@ def annotate_photo(photo_path, output_path, measurements):
         draw.text((scale_x + scale_length // 2 - 40, scale_y - 30), 
                  f"{scale_feet} feet", fill=(255, 255, 255), font=data_font)
     
-    # Save annotated image
-    img.save(output_path, quality=95)
+    # Save annotated image. 4:2:0 subsampling keeps the encoder on its fast
+    # path (quality=95 would otherwise force 4:4:4) — annotation banners
+    # don't need full chroma resolution
+    img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
+    img.save(output_path, quality=95, subsampling=2, optimize=False)
     print(f"✅ Annotated photo saved to: {output_path}")
 
 def interactive_annotate(photo_path):
@@ -173,12 +182,51 @@ def batch_annotate(photo_path, metadata_path):
     """Annotate using a metadata JSON file"""
     with open(metadata_path, 'r') as f:
         measurements = json.load(f)
-    
+
     base_name = os.path.splitext(photo_path)[0]
     output_path = f"{base_name}_annotated.jpg"
-    
+
     annotate_photo(photo_path, output_path, measurements)
 
+def _annotate_one(job):
+    """Annotate a single (photo, metadata) pair (picklable for workers)"""
+    photo_path, metadata_path = job
+    try:
+        batch_annotate(photo_path, metadata_path)
+    except Exception as e:
+        print(f"❌ Error annotating {photo_path}: {e}")
+
+def directory_annotate(directory):
+    """Annotate every photo with a *_metadata.json sidecar in a directory
+
+    JPEG decode/encode is CPU-bound and per-file independent, so larger
+    batches fan out across one worker process per core.
+    """
+    jobs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith('_metadata.json') or not entry.is_file():
+                continue
+            base = entry.path[:-len('_metadata.json')]
+            for ext in ('.jpg', '.jpeg', '.png'):
+                if os.path.exists(base + ext):
+                    jobs.append((base + ext, entry.path))
+                    break
+            else:
+                print(f"⚠️  No photo found for {entry.name}")
+
+    if not jobs:
+        print(f"❌ No photo/metadata pairs found in {directory}")
+        return
+
+    print(f"📷 Annotating {len(jobs)} photos...")
+    if len(jobs) < 4:
+        for job in jobs:
+            _annotate_one(job)
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(_annotate_one, jobs))
+
 def main():
     if len(sys.argv) < 2:
         print("Usage:")
@@ -186,17 +234,24 @@ def main():
         print("    python3 photo-annotator.py <photo.jpg>")
         print("\n  Batch mode with metadata:")
         print("    python3 photo-annotator.py <photo.jpg> <metadata.json>")
+        print("\n  Batch mode over a directory (photos with *_metadata.json sidecars):")
+        print("    python3 photo-annotator.py <directory>")
         print("\nExample:")
         print("  python3 photo-annotator.py lightpole.jpg")
         print("  python3 photo-annotator.py lightpole.jpg lightpole_metadata.json")
+        print("  python3 photo-annotator.py photos/")
         sys.exit(1)
-    
+
     photo_path = sys.argv[1]
-    
+
+    if os.path.isdir(photo_path):
+        directory_annotate(photo_path)
+        return
+
     if not os.path.exists(photo_path):
         print(f"❌ Error: Photo not found: {photo_path}")
         sys.exit(1)
-    
+
     if len(sys.argv) > 2:
         # Batch mode
         metadata_path = sys.argv[2]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Disk cache for parsed hackrf_sweep scans
+Keyed on (parser, path, mtime, size) so edits invalidate automatically
+
+The disk tier is shared by every analysis script: running
+detailed-analysis and then multipath-analysis on the same capture parses
+it once, and later runs map the cached arrays straight from disk.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+CACHE_DIR = os.path.expanduser('~/Library/Application Support/EpiRay/scan_cache')
+
+# Bound for the in-memory tier (parsed scans kept per process)
+MEMORY_CACHE_SIZE = 64
+
+def memoize_scan(parse_func):
+    """Wrap a (path) -> (freqs, means) parser with a two-tier cache
+
+    First tier is an in-process LRU, second tier is a memory-mapped .npy
+    file under CACHE_DIR holding the stacked (freqs, means) rows — repeat
+    analyses share pages instead of each materializing their own copy.
+    A scan is re-parsed only when its mtime or size changes.
+    """
+    memory_cache = OrderedDict()
+
+    def wrapper(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Missing file: let the parser handle/report it
+            return parse_func(path)
+
+        key = hashlib.blake2b(
+            f"{parse_func.__name__}|{path}|{st.st_mtime_ns}|{st.st_size}".encode()).hexdigest()
+
+        if key in memory_cache:
+            memory_cache.move_to_end(key)
+            return memory_cache[key]
+
+        cache_file = os.path.join(CACHE_DIR, f"{key}.npy")
+        try:
+            # One row per returned array, however many the parser yields
+            result = tuple(np.load(cache_file, mmap_mode='r'))
+        except (OSError, IndexError, ValueError):
+            result = parse_func(path)
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                np.save(cache_file, np.vstack(result))
+            except (OSError, ValueError):
+                pass  # cache is best-effort; the parse result still stands
+
+        if len(memory_cache) >= MEMORY_CACHE_SIZE:
+            memory_cache.popitem(last=False)
+        memory_cache[key] = result
+        return result
+
+    return wrapper
+
+def clear_cache():
+    """Drop every cached scan from the disk tier
+
+    Entries for edited or deleted scans are never read again (the key
+    covers mtime and size), so this exists for reclaiming space rather
+    than correctness.
+    """
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.npy'):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
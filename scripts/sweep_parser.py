@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Shared parser for hackrf_sweep CSV files
+Format: date, time, hz_low, hz_high, hz_bin_width, num_samples, dB, dB, ...
+"""
+
+import io
+from collections import defaultdict
+from itertools import islice
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from scan_cache import memoize_scan
+
+def _reduce_segments(hz_low, hz_bin_width, powers):
+    """Accumulate repeated sweep rows into per-segment (freq, sum, count) arrays
+
+    Rows sharing a (hz_low, bin_width) segment are summed straight into one
+    row per segment, so no per-row frequency matrix is ever materialized.
+    """
+    n_bins = powers.shape[1]
+    segments, inverse = np.unique(
+        np.stack([hz_low.astype(np.float64), hz_bin_width], axis=1),
+        axis=0, return_inverse=True)
+    sums = np.zeros((len(segments), n_bins))
+    np.add.at(sums, inverse, powers)
+    counts = np.bincount(inverse, minlength=len(segments))
+
+    bins = np.arange(n_bins)
+    freqs = segments[:, 0][:, np.newaxis] + bins[np.newaxis, :] * segments[:, 1][:, np.newaxis]
+    return freqs.ravel(), sums.ravel(), np.repeat(counts, n_bins)
+
+def _stat_segments(hz_low, hz_bin_width, powers):
+    """Accumulate repeated sweep rows into per-segment running statistics
+
+    Same grouping as _reduce_segments, but alongside the power sums it keeps
+    the squared sums and running min/max per bin so callers can recover the
+    full per-bin distribution in one pass.
+    """
+    n_bins = powers.shape[1]
+    segments, inverse = np.unique(
+        np.stack([hz_low.astype(np.float64), hz_bin_width], axis=1),
+        axis=0, return_inverse=True)
+    sums = np.zeros((len(segments), n_bins))
+    sumsqs = np.zeros((len(segments), n_bins))
+    mins = np.full((len(segments), n_bins), np.inf)
+    maxs = np.full((len(segments), n_bins), -np.inf)
+    np.add.at(sums, inverse, powers)
+    np.add.at(sumsqs, inverse, powers * powers)
+    np.minimum.at(mins, inverse, powers)
+    np.maximum.at(maxs, inverse, powers)
+    counts = np.bincount(inverse, minlength=len(segments))
+
+    bins = np.arange(n_bins)
+    freqs = segments[:, 0][:, np.newaxis] + bins[np.newaxis, :] * segments[:, 1][:, np.newaxis]
+    return (freqs.ravel(), sums.ravel(), sumsqs.ravel(),
+            mins.ravel(), maxs.ravel(), np.repeat(counts, n_bins))
+
+# Rows parsed per block. Each block collapses into per-segment running sums
+# before the next is read, so memory stays bounded no matter how long the
+# capture ran.
+CHUNK_ROWS = 4096
+
+def _parse_block(text, width):
+    """Parse uniform-width CSV text into (hz_low, hz_bin_width, powers)"""
+    if pd is not None:
+        # pandas' C engine tokenizes fields in native code, well ahead of
+        # np.loadtxt on multi-MB captures
+        try:
+            data = pd.read_csv(io.StringIO(text), header=None, usecols=range(2, width),
+                               dtype=np.float64, engine='c').to_numpy()
+        except (ValueError, pd.errors.ParserError):
+            return None
+    else:
+        try:
+            data = np.loadtxt(io.StringIO(text), delimiter=',',
+                              usecols=range(2, width), ndmin=2)
+        except ValueError:
+            return None
+    if not data.size:
+        return None
+    if np.isnan(data).any():
+        # pandas turns empty trailing fields (rows ending in ', ') into
+        # NaN where loadtxt would error out; reject the block so both
+        # engines take the ragged fallback, which strips those fields
+        return None
+    return data[:, 0], data[:, 2], data[:, 4:]
+
+def _ragged_blocks(lines):
+    """Group mixed-width rows by column count so each group still converts
+    as one typed 2-D block; only the numeric columns are materialized"""
+    rows_by_width = defaultdict(list)
+    for line in lines:
+        row = line.split(',')
+        # Drop trailing empty fields so the power matrix converts cleanly;
+        # lines that were already clean pass through without a re-join
+        end = len(row)
+        while end and not row[end - 1].strip():
+            end -= 1
+        if end >= 7:
+            rows_by_width[end].append(
+                line.rstrip('\n') if end == len(row) else ','.join(row[:end]))
+
+    for row_width, rows in rows_by_width.items():
+        block = _parse_block('\n'.join(rows), row_width)
+        if block is not None:
+            yield block
+
+def _read_blocks(filename):
+    """Yield (hz_low, hz_bin_width, powers) arrays in bounded-size blocks"""
+    with open(filename, 'r') as f:
+        # Fast path: rows matching the first row's width (the normal
+        # hackrf_sweep fixed schema) parse as one compiled call per chunk;
+        # anything ragged falls back to per-width grouping for that chunk only
+        width = len(f.readline().split(','))
+        f.seek(0)
+        while True:
+            lines = list(islice(f, CHUNK_ROWS))
+            if not lines:
+                return
+            block = _parse_block(''.join(lines), width) if width >= 7 else None
+            if block is not None:
+                yield block
+            else:
+                yield from _ragged_blocks(lines)
+
+@memoize_scan
+def load_bins(filename):
+    """Load a hackrf_sweep CSV and return sorted (freqs, means) NumPy arrays"""
+    chunks = [_reduce_segments(*block) for block in _read_blocks(filename)]
+
+    if not chunks:
+        return np.array([]), np.array([])
+
+    all_freqs = np.concatenate([c[0] for c in chunks])
+    all_sums = np.concatenate([c[1] for c in chunks])
+    all_counts = np.concatenate([c[2] for c in chunks])
+
+    # Merge any bins still shared across segments (overlapping sweeps)
+    freqs, inverse = np.unique(all_freqs, return_inverse=True)
+    sums = np.zeros(len(freqs))
+    counts = np.zeros(len(freqs))
+    np.add.at(sums, inverse, all_sums)
+    np.add.at(counts, inverse, all_counts)
+    means = sums / counts
+
+    return freqs, means
+
+@memoize_scan
+def load_bin_stats(filename):
+    """Load a hackrf_sweep CSV and return sorted per-bin statistics
+
+    Returns (freqs, means, mins, maxs, variances, counts) arrays, all aligned
+    on the sorted bin axis. Variance is the population variance recovered
+    from the running sums, so the file is still read in a single pass.
+    """
+    chunks = [_stat_segments(*block) for block in _read_blocks(filename)]
+
+    if not chunks:
+        return (np.array([]),) * 6
+
+    all_freqs = np.concatenate([c[0] for c in chunks])
+
+    # Merge any bins still shared across segments (overlapping sweeps)
+    freqs, inverse = np.unique(all_freqs, return_inverse=True)
+    sums = np.zeros(len(freqs))
+    sumsqs = np.zeros(len(freqs))
+    mins = np.full(len(freqs), np.inf)
+    maxs = np.full(len(freqs), -np.inf)
+    counts = np.zeros(len(freqs))
+    np.add.at(sums, inverse, np.concatenate([c[1] for c in chunks]))
+    np.add.at(sumsqs, inverse, np.concatenate([c[2] for c in chunks]))
+    np.minimum.at(mins, inverse, np.concatenate([c[3] for c in chunks]))
+    np.maximum.at(maxs, inverse, np.concatenate([c[4] for c in chunks]))
+    np.add.at(counts, inverse, np.concatenate([c[5] for c in chunks]))
+
+    means = sums / counts
+    variances = np.maximum(sumsqs / counts - means * means, 0.0)
+
+    return freqs, means, mins, maxs, variances, counts
+
+def nearest_bin_indices(freqs, key_freqs):
+    """Binary-search a sorted bin array for the bin closest to each key"""
+    if len(freqs) == 1:
+        return np.zeros(len(key_freqs), dtype=np.intp)
+    idx = np.clip(np.searchsorted(freqs, key_freqs), 1, len(freqs) - 1)
+    left = freqs[idx - 1]
+    right = freqs[idx]
+    return np.where(key_freqs - left < right - key_freqs, idx - 1, idx)
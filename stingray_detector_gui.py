@@ -5,8 +5,18 @@ Stingray Detector GUI - Visual step-by-step directional scanning
 
 import sys
 import os
+import math
+import re
+import signal
 import subprocess
-from datetime import datetime
+import time
+from collections import deque
+from dataclasses import dataclass
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QProgressBar,
                              QTextEdit, QStackedWidget, QMessageBox, QDialog,
@@ -14,11 +24,435 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QTabWidget, QGroupBox, QGridLayout, QTimeEdit,
                              QCheckBox, QSpinBox, QFileDialog, QLineEdit,
                              QScrollArea)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTime
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QFont, QColor
+from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QTime, QTimer, QObject,
+                          QRunnable, QThreadPool)
+from PyQt6.QtGui import (QPixmap, QPainter, QPen, QFont, QColor, QPainterPath,
+                         QTextCursor, QImage, QImageReader)
 import json
 import webbrowser
 from PIL import Image, ImageDraw, ImageFont
+from PIL.ImageQt import ImageQt
+
+# Repo root, resolved once — every worker thread runs its subprocess here
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Filename timestamp format for scan passes
+_TS_FMT = '%Y%m%d_%H%M%S'
+
+# Annotation fonts, parsed from disk once — annotate_photo would otherwise
+# re-read and re-parse the .ttc three times per photo
+try:
+    _TITLE_FONT = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
+    _LABEL_FONT = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
+    _DATA_FONT = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 35)
+except OSError:
+    _TITLE_FONT = _LABEL_FONT = _DATA_FONT = ImageFont.load_default()
+
+# Dark theme plus per-role button styles, parsed once. Buttons opt into a
+# role with setObjectName instead of each carrying its own stylesheet.
+_APP_QSS = """
+    QMainWindow, QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 8px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #4d4d4d;
+    }
+    QPushButton:pressed {
+        background-color: #2d2d2d;
+    }
+    QTextEdit, QLineEdit, QSpinBox, QDoubleSpinBox, QTimeEdit {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 4px;
+        border-radius: 3px;
+    }
+    QProgressBar {
+        background-color: #3d3d3d;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        text-align: center;
+        color: #ffffff;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+    }
+    QGroupBox {
+        border: 1px solid #555555;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #555555;
+        background-color: #2b2b2b;
+    }
+    QTabBar::tab {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        padding: 8px 16px;
+        border: 1px solid #555555;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: #2b2b2b;
+        border-bottom: 1px solid #2b2b2b;
+    }
+    QCheckBox {
+        color: #ffffff;
+    }
+    QScrollArea {
+        background-color: #2b2b2b;
+        border: none;
+    }
+    QPushButton#scanAction {
+        background-color: #4CAF50;
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 15px;
+        border-radius: 5px;
+    }
+    QPushButton#scanAction:hover {
+        background-color: #45a049;
+    }
+    QPushButton#scanAction:disabled {
+        background-color: #666666;
+    }
+    QPushButton#testAction {
+        background-color: #4CAF50;
+        color: white;
+        font-size: 14px;
+        padding: 15px;
+        border-radius: 5px;
+        min-height: 60px;
+    }
+    QPushButton#testAction:hover {
+        background-color: #45a049;
+    }
+    QPushButton#testAction:disabled {
+        background-color: #cccccc;
+    }
+    QPushButton#saveAction {
+        background-color: #2196F3;
+        color: white;
+        font-size: 14px;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#saveAction:hover {
+        background-color: #0b7dda;
+    }
+    QPushButton#stopAction {
+        background-color: #f44336;
+        color: white;
+        font-size: 14px;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#stopAction:hover {
+        background-color: #da190b;
+    }
+    QPushButton#stopAction:disabled {
+        background-color: #cccccc;
+    }
+    QPushButton#refreshAction {
+        background-color: #2196F3;
+        color: white;
+        padding: 5px 15px;
+        border-radius: 3px;
+        font-size: 12px;
+    }
+    QPushButton#refreshAction:hover {
+        background-color: #0b7dda;
+    }
+    QPushButton#annotateAction {
+        background-color: #9C27B0;
+        color: white;
+        font-size: 16px;
+        padding: 12px;
+        border-radius: 5px;
+    }
+    QPushButton#annotateAction:hover {
+        background-color: #7B1FA2;
+    }
+    QPushButton#githubAction {
+        background-color: #24292e;
+        color: white;
+        font-size: 16px;
+        padding: 15px;
+        border-radius: 5px;
+    }
+    QPushButton#githubAction:hover {
+        background-color: #1b1f23;
+    }
+    QPushButton#communityAction {
+        background-color: #0366d6;
+        color: white;
+        font-size: 14px;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#communityAction:hover {
+        background-color: #0256c7;
+    }
+    QPushButton#heightAction {
+        background-color: #FF9800;
+        color: white;
+        font-size: 14px;
+        padding: 8px;
+        border-radius: 5px;
+    }
+    QPushButton#heightAction:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#analyzeAction {
+        background-color: #2196F3;
+        color: white;
+        font-size: 16px;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QPushButton#analyzeAction:hover {
+        background-color: #0b7dda;
+    }
+"""
+
+def kill_processes(names):
+    """Terminate any running processes with the given names
+
+    Signals matching PIDs in-process via psutil and waits only on the
+    ones actually signalled, so the common no-HackRF-running case costs
+    one process-table scan instead of two killall forks and a fixed sleep.
+    """
+    if psutil is None:
+        # Fallback: shell out when psutil isn't installed; killall takes
+        # every name in one invocation, so one fork covers them all
+        subprocess.run(['killall', *names], stderr=subprocess.DEVNULL)
+        time.sleep(2)
+        return
+
+    signalled = []
+    for proc in psutil.process_iter(['name']):
+        if proc.info['name'] in names:
+            try:
+                proc.send_signal(signal.SIGTERM)
+                signalled.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    if signalled:
+        gone, alive = psutil.wait_procs(signalled, timeout=1.0)
+        for proc in alive:
+            try:
+                proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+class _ProgressThrottle:
+    """Coalesce rapid progress updates into at most one emission per interval
+
+    Cross-thread signal emissions are not free, and a chatty subprocess can
+    flood the GUI event queue. Latest message wins; intermediate ones are
+    dropped, which is the right semantics for a status line.
+    """
+
+    def __init__(self, emit, interval=0.1):
+        self._emit = emit
+        self._interval = interval
+        self._pending = None
+        self._last = 0.0
+
+    def push(self, message):
+        self._pending = message
+        if time.monotonic() - self._last >= self._interval:
+            self.flush()
+
+    def flush(self):
+        if self._pending is not None:
+            self._emit(self._pending)
+            self._pending = None
+            self._last = time.monotonic()
+
+def append_log(widget, text):
+    """Append a line to a QTextEdit without the full append() machinery
+
+    QTextEdit.append starts a new paragraph with cursor/selection churn
+    and can trigger a relayout per call; a plain end-of-document
+    insertText keeps long logs close to O(lines) instead of O(lines^2).
+    """
+    cursor = widget.textCursor()
+    cursor.movePosition(QTextCursor.MoveOperation.End)
+    cursor.insertText(text + '\n')
+    widget.setTextCursor(cursor)
+
+class _ScheduleSaveTask(QRunnable):
+    """Write the schedule file on a pool thread, reporting back via signal
+
+    QRunnable cannot carry signals itself, so a small QObject rides along.
+    """
+
+    class Signals(QObject):
+        # mtime_ns needs the 64-bit slot: a plain int maps to a C++ int
+        # and nanosecond timestamps overflow it on emit
+        done = pyqtSignal(bool, 'qint64', str)  # success, mtime_ns, error text
+
+    def __init__(self, schedule_file, schedule):
+        super().__init__()
+        self.schedule_file = schedule_file
+        self.schedule = schedule
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            # Write-then-rename so a crash mid-save can't truncate the file
+            tmp_file = self.schedule_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                # Compact dump: indent forces the slow pretty-printing path
+                # and nothing reads this file by eye
+                json.dump(self.schedule, f)
+            os.replace(tmp_file, self.schedule_file)
+            self.signals.done.emit(True, os.stat(self.schedule_file).st_mtime_ns, '')
+        except Exception as e:
+            self.signals.done.emit(False, 0, str(e))
+
+class _PreviewLoadTask(QRunnable):
+    """Decode and downscale a photo for the preview pane on a pool thread
+
+    QImageReader scales while it decodes, so the full-resolution frame is
+    never materialized. The result crosses back as a QImage — QPixmap
+    conversion has to happen on the GUI thread.
+    """
+
+    class Signals(QObject):
+        ready = pyqtSignal(QImage)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = self.Signals()
+
+    def run(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(800, 600, Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(size)
+        self.signals.ready.emit(reader.read())
+
+class _AnnotateTask(QRunnable):
+    """Annotate a photo on a pool thread and hand back a preview image
+
+    PIL releases the GIL inside its codec routines, so the decode and the
+    quality-95 encode overlap the event loop instead of freezing it. The
+    preview crosses back as a QImage — QPixmap conversion stays on the
+    GUI thread.
+    """
+
+    class Signals(QObject):
+        done = pyqtSignal(str, QImage)  # output path, preview image
+        error = pyqtSignal(str)
+
+    def __init__(self, photo_path, measurements):
+        super().__init__()
+        self.photo_path = photo_path
+        self.measurements = measurements
+        self.signals = self.Signals()
+
+    def run(self):
+        measurements = self.measurements
+        try:
+            base_name = os.path.splitext(self.photo_path)[0]
+            output_path = f"{base_name}_annotated.jpg"
+
+            # Annotate using PIL; the 'RGBA' draw context blends translucent
+            # fills in place, so the overlay bars never need their own
+            # full-width RGBA images pasted over the photo
+            img = Image.open(self.photo_path)
+            if img.format == 'JPEG':
+                # Let libjpeg downscale oversized sources inside the DCT
+                # decode itself — far cheaper than decoding full-res and
+                # resampling, and a no-op for photos already within bounds
+                img.draft('RGB', (4000, 4000))
+            draw = ImageDraw.Draw(img, 'RGBA')
+
+            width, height = img.size
+
+            # Fonts are loaded once at import (_TITLE_FONT and friends)
+            title_font = _TITLE_FONT
+            label_font = _LABEL_FONT
+            data_font = _DATA_FONT
+
+            # Top overlay
+            draw.rectangle([0, 0, width, 200], fill=(0, 0, 0, 180))
+
+            # Title
+            draw.text((20, 20), f"🎯 {measurements['species']}",
+                      fill=(255, 255, 255), font=title_font)
+
+            # Measurements
+            y = 90
+            if measurements['distance']:
+                draw.text((20, y), f"📏 Distance: {measurements['distance']}",
+                          fill=(255, 200, 0), font=label_font)
+                y += 50
+
+            if measurements['direction']:
+                draw.text((20, y), f"🧭 Direction: {measurements['direction']}",
+                          fill=(255, 200, 0), font=label_font)
+
+            # Bottom overlay
+            draw.rectangle([0, height - 150, width, height], fill=(0, 0, 0, 180))
+
+            # Bottom info
+            y_bottom = height - 130
+            if measurements['height']:
+                draw.text((20, y_bottom), f"📐 Height: {measurements['height']}",
+                          fill=(100, 200, 255), font=data_font)
+                y_bottom += 45
+
+            if measurements['signal_strength']:
+                draw.text((20, y_bottom), f"📡 Signal: {measurements['signal_strength']}",
+                          fill=(255, 100, 100), font=data_font)
+
+            # Save; 4:2:0 chroma subsampling is indistinguishable at this
+            # quality and roughly halves the file, and skipping progressive
+            # encoding drops the extra scan pass
+            img.save(output_path, quality=95, subsampling=2, progressive=False)
+
+            # Preview from the image still in memory — no need to redecode
+            # the JPEG that was just written
+            preview = img.copy()
+            preview.thumbnail((800, 600))
+            # copy() detaches the pixel buffer from the ImageQt/PIL
+            # temporaries, which die with run() before the queued
+            # cross-thread delivery reaches the GUI slot
+            self.signals.done.emit(output_path, ImageQt(preview.convert('RGB')).copy())
+        except FileNotFoundError:
+            # No pre-flight exists() check — Image.open reports a missing
+            # file itself, without the extra stat and its TOCTOU window
+            self.signals.error.emit('Photo file not found. Please select a photo first.')
+        except Exception as e:
+            self.signals.error.emit(f'Failed to annotate photo:\n{e}')
 
 class MonitorThread(QThread):
     """Background thread for running monitoring scans"""
@@ -29,51 +463,246 @@ class MonitorThread(QThread):
         super().__init__()
         self.duration_minutes = duration_minutes
         self.interval_seconds = interval_seconds
+        self.proc = None
+        self.user_stopped = False
         
     def run(self):
         try:
             self.progress.emit(f"Starting {self.duration_minutes} minute monitoring...")
             
             # Kill any existing HackRF processes
-            subprocess.run(['killall', 'hackrf_sweep'], stderr=subprocess.DEVNULL)
-            subprocess.run(['killall', 'hackrf_info'], stderr=subprocess.DEVNULL)
-            import time
-            time.sleep(2)
+            kill_processes(('hackrf_sweep', 'hackrf_info'))
             
-            # Run tracking script
-            result = subprocess.run(
+            # Run tracking script in its own process group so stop() can
+            # signal the script and every hackrf_sweep it spawns directly.
+            # Output is streamed line by line — a session lasting hours
+            # never accumulates its whole transcript in memory
+            self.proc = subprocess.Popen(
                 ['./track-movement.sh', str(self.duration_minutes), str(self.interval_seconds)],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__))
+                bufsize=-1,
+                cwd=_BASE_DIR,
+                start_new_session=True
             )
+            # Keep only a tail for the failure message
+            tail = deque(maxlen=50)
+            for line in self.proc.stdout:
+                stripped = line.rstrip()
+                if stripped:
+                    tail.append(stripped)
+                    self.progress.emit(stripped)
+            returncode = self.proc.wait()
             
-            if result.returncode == 0:
+            if self.user_stopped:
+                # The stop was announced by the GUI already; finish quietly
+                self.finished.emit(True, '')
+            elif returncode == 0:
                 self.finished.emit(True, "Monitoring completed successfully!")
             else:
-                self.finished.emit(False, f"Monitoring failed: {result.stderr}")
+                self.finished.emit(False, "Monitoring failed: " + "\n".join(tail))
                 
         except Exception as e:
             self.finished.emit(False, str(e))
+    
+    def stop(self):
+        """Signal the tracking script's process group to terminate
+        
+        Delivers SIGTERM straight to the PIDs this thread owns — no
+        killall fork and no risk of matching unrelated processes.
+        """
+        self.user_stopped = True
+        proc = self.proc
+        if proc is not None and proc.poll() is None:
+            try:
+                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+# All the hackrf_info markers in one pattern so the probe scans its
+# output a single time instead of once per substring
+_HRF_RE = re.compile(r'Found HackRF|Serial number:\s*(\S+)|Access denied|insufficient permissions')
+
+class HackrfProbeThread(QThread):
+    """Background hackrf_info probe so refreshes never stall the event loop"""
+    result = pyqtSignal(str, str, str)  # indicator text, color, detail text
+
+    def run(self):
+        try:
+            result = subprocess.run(
+                ['hackrf_info'],
+                capture_output=True,
+                text=True,
+                timeout=3
+            )
+            
+            found = denied = False
+            serial = None
+            for m in _HRF_RE.finditer(result.stdout):
+                if m.group(1):
+                    serial = m.group(1)
+                elif m.group(0) == 'Found HackRF':
+                    found = True
+                else:
+                    denied = True
+            
+            if found:
+                # Serial is masked for privacy (show only last 4 chars)
+                if serial is not None:
+                    masked_serial = "XXXXXXXXXXXX" + serial[-4:] if len(serial) > 4 else "XXXX"
+                else:
+                    masked_serial = None
+                
+                if denied:
+                    detail = (f"Serial: {masked_serial} - Run scripts with sudo for access"
+                              if masked_serial else "")
+                    self.result.emit("● Connected (Need Sudo)", "orange", detail)
+                else:
+                    detail = (f"Serial: {masked_serial} - Ready to scan"
+                              if masked_serial else "")
+                    self.result.emit("● Connected", "#4caf50", detail)
+            else:
+                self.result.emit("● Not Found", "#f44336",
+                                 "Connect HackRF via USB and click Refresh")
+                
+        except subprocess.TimeoutExpired:
+            self.result.emit("● Timeout", "orange",
+                             "HackRF not responding - check connection")
+        except FileNotFoundError:
+            self.result.emit("● Not Installed", "#f44336",
+                             "Install HackRF tools: brew install hackrf")
+        except Exception as e:
+            self.result.emit("● Error", "#f44336", str(e))
+
+class AnalyzeThread(QThread):
+    """Background thread for running the analysis scripts"""
+    progress = pyqtSignal(str)  # text chunks for the results pane
+    finished = pyqtSignal(bool, str, str)  # success, status text, dialog message
+
+    def __init__(self, antenna_height):
+        super().__init__()
+        self.antenna_height = antenna_height
+
+    def run(self):
+        compare = estimate = None
+        try:
+            # Both scripts read detection-logs/directional/ independently,
+            # so they run concurrently and wall time is the slower of the
+            # two instead of their sum. Output is still presented in order.
+            self.progress.emit("Running directional comparison...\n")
+
+            compare = subprocess.Popen(
+                ['python3', 'scripts/compare-directions.py', 'detection-logs/directional/'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=_BASE_DIR,
+            )
+            estimate = subprocess.Popen(
+                ['python3', 'scripts/estimate-position.py',
+                 'detection-logs/directional/', str(self.antenna_height)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=_BASE_DIR,
+            )
+
+            out, err = compare.communicate(timeout=30)
+            if compare.returncode == 0:
+                self.progress.emit(out)
+            else:
+                self.progress.emit(f"⚠️ Comparison script error:\n{err}\n")
+
+            self.progress.emit("\n\n=== Position Estimation ===\n")
+
+            out, err = estimate.communicate(timeout=30)
+            if estimate.returncode == 0:
+                self.progress.emit(out)
+                self.finished.emit(
+                    True,
+                    '✅ Analysis complete!',
+                    'Directional analysis and position estimation complete!\n\n'
+                    'Check the results above for signal source location.'
+                )
+            else:
+                self.progress.emit(f"⚠️ Position estimation error:\n{err}\n")
+                self.finished.emit(False, '⚠️ Analysis completed with warnings', '')
+
+        except subprocess.TimeoutExpired:
+            for proc in (compare, estimate):
+                if proc is not None and proc.poll() is None:
+                    proc.kill()
+            self.progress.emit("\n\n❌ Error: Analysis timed out (took longer than 30 seconds)")
+            self.finished.emit(
+                False,
+                '❌ Analysis timed out',
+                'Analysis took too long and was cancelled.\n\n'
+                'This may indicate an issue with the scan data or analysis scripts.'
+            )
+        except FileNotFoundError as e:
+            self.progress.emit(f"\n\n❌ Error: Required file not found\n{str(e)}")
+            self.finished.emit(
+                False,
+                '❌ Analysis failed',
+                f'Could not find required files:\n{str(e)}\n\n'
+                'Make sure all scan files are in detection-logs/directional/'
+            )
+        except Exception as e:
+            self.progress.emit(f"\n\n❌ Unexpected error: {str(e)}\n")
+            self.finished.emit(
+                False,
+                '❌ Analysis failed',
+                f'An error occurred during analysis:\n{str(e)}'
+            )
+
+@dataclass(frozen=True, slots=True)
+class Direction:
+    """One scan step: compass name, operator instructions, bearing
+
+    angle is the compass bearing in degrees, or None for the up/down
+    elevation steps.
+    """
+    name: str
+    description: str
+    angle: int | None
+
+# The fixed scan sequence, shared immutably across the whole app
+_DIRECTIONS = (
+    Direction('north', 'Point antenna toward the north', 0),
+    Direction('south', 'Point antenna toward the south', 180),
+    Direction('east', 'Point antenna toward the east', 90),
+    Direction('west', 'Point antenna toward the west', 270),
+    Direction('southwest', 'Point antenna toward the southwest (lightpole direction)', 225),
+    Direction('northeast', 'Point antenna toward the northeast (building direction)', 45),
+    Direction('up', 'Point antenna upward toward the sky', None),
+    Direction('down', 'Point antenna downward toward the ground', None),
+)
+
+@dataclass(slots=True)
+class ScanRecord:
+    """One completed directional scan; stored slot-aligned with directions"""
+    direction: str
+    filepath: str
+    timestamp: str
+    ok: bool
 
 class ScanThread(QThread):
     """Background thread for running HackRF scans"""
+    progress = pyqtSignal(str)  # hackrf_sweep status lines
     finished = pyqtSignal(str, str)  # direction, output
     error = pyqtSignal(str)
     
-    def __init__(self, direction):
+    def __init__(self, direction, timestamp):
         super().__init__()
         self.direction = direction
+        self.timestamp = timestamp
         
     def run(self):
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_file = f"detection-logs/directional/{self.direction}_{timestamp}.csv"
+            output_file = f"detection-logs/directional/{self.direction}_{self.timestamp}.csv"
             
-            # Ensure directory exists
-            os.makedirs("detection-logs/directional", exist_ok=True)
-            
-            # Run hackrf_sweep
+            # Run hackrf_sweep (output directory is created at app startup)
             cmd = [
                 'hackrf_sweep',
                 '-f', '750:770',
@@ -85,20 +714,192 @@ class ScanThread(QThread):
                 '-r', output_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, 
-                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+            # -r already writes the CSV, so stdout is dropped instead of
+            # buffered; stderr is streamed line by line for live progress
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE, text=True,
+                                    cwd=_BASE_DIR)
+            throttle = _ProgressThrottle(self.progress.emit)
+            # Bounded tail: enough context for the error dialog without
+            # letting a pathological sweep grow the buffer unchecked
+            stderr_tail = deque(maxlen=200)
+            for line in proc.stderr:
+                stderr_tail.append(line)
+                stripped = line.strip()
+                if stripped:
+                    throttle.push(stripped)
+            throttle.flush()
             
-            if result.returncode == 0:
+            if proc.wait() == 0:
                 self.finished.emit(self.direction, output_file)
             else:
-                self.error.emit(f"Scan failed: {result.stderr}")
+                self.error.emit(f"Scan failed: {''.join(stderr_tail)}")
                 
         except Exception as e:
             self.error.emit(str(e))
 
+# QFont construction consults Qt's font database, so the handful of fonts
+# used across the UI are built once on first use and reused everywhere
+_font_cache = {}
+
+def app_font(family, size, weight=None):
+    """Return a shared QFont, constructing each (family, size, weight) once"""
+    key = (family, size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        font = QFont(family, size) if weight is None else QFont(family, size, weight)
+        _font_cache[key] = font
+    return font
+
+# Static compass rose shared by every DirectionWidget; painted lazily once
+# per size and reused — only the arrow and label differ between directions
+_rose_cache = {}
+
+def _compass_rose(width, height):
+    """Return the cached compass-rose pixmap (circle, labels, HackRF body)"""
+    key = (width, height)
+    pixmap = _rose_cache.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(width, height)
+    pixmap.fill(QColor(43, 43, 43))  # Dark background
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    center_x, center_y = width // 2, height // 2
+
+    # Draw circle
+    painter.setPen(QPen(Qt.GlobalColor.white, 2))
+    painter.drawEllipse(center_x - 100, center_y - 100, 200, 200)
+
+    # Draw cardinal directions
+    painter.setPen(QPen(Qt.GlobalColor.white))
+    painter.setFont(app_font('Arial', 14, QFont.Weight.Bold))
+    painter.drawText(center_x - 10, center_y - 110, "N")
+    painter.drawText(center_x - 10, center_y + 125, "S")
+    painter.drawText(center_x + 110, center_y + 5, "E")
+    painter.drawText(center_x - 125, center_y + 5, "W")
+
+    # Draw intercardinal directions
+    painter.setFont(app_font('Arial', 12))
+    painter.drawText(center_x + 75, center_y - 75, "NE")
+    painter.drawText(center_x + 75, center_y + 85, "SE")
+    painter.drawText(center_x - 95, center_y + 85, "SW")
+    painter.drawText(center_x - 95, center_y - 75, "NW")
+
+    # Draw HackRF (rectangle in center)
+    hackrf_width, hackrf_height = 60, 40
+    painter.setBrush(QColor(100, 100, 200))
+    painter.drawRect(center_x - hackrf_width//2, center_y - hackrf_height//2,
+                    hackrf_width, hackrf_height)
+
+    painter.end()
+    _rose_cache[key] = pixmap
+    return pixmap
+
+# Finished per-direction diagrams, shared by every widget that shows one.
+# QPixmap is refcounted, so eight pixmaps exist at most no matter how many
+# times the scanner tab is rebuilt. Built lazily because pixmaps need a
+# live QApplication.
+_diagram_cache = {}
+
+def direction_diagram(direction, angle):
+    """Return the cached compass diagram with the arrow for one direction"""
+    pixmap = _diagram_cache.get(direction)
+    if pixmap is not None:
+        return pixmap
+
+    # Start from the shared rose; QPixmap is copy-on-write, so the copy
+    # detaches only when the arrow is painted onto it
+    pixmap = QPixmap(_compass_rose(500, 300))
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    center_x, center_y = 250, 150
+
+    # Draw antenna direction arrow
+    painter.setPen(QPen(Qt.GlobalColor.red, 4))
+    painter.setBrush(Qt.GlobalColor.red)
+
+    # Calculate arrow endpoint based on direction
+    arrow_length = 80
+    angle_rad = math.radians(angle)
+    end_x = center_x + arrow_length * math.sin(angle_rad)
+    end_y = center_y - arrow_length * math.cos(angle_rad)
+
+    arrow_size = 15
+    angle1 = angle_rad + math.radians(150)
+    angle2 = angle_rad - math.radians(150)
+
+    point1_x = end_x + arrow_size * math.cos(angle1)
+    point1_y = end_y + arrow_size * math.sin(angle1)
+    point2_x = end_x + arrow_size * math.cos(angle2)
+    point2_y = end_y + arrow_size * math.sin(angle2)
+
+    # Line and arrowhead as one path, drawn with a single paint call
+    path = QPainterPath()
+    path.moveTo(center_x, center_y)
+    path.lineTo(end_x, end_y)
+    path.moveTo(end_x, end_y)
+    path.lineTo(point1_x, point1_y)
+    path.lineTo(point2_x, point2_y)
+    path.closeSubpath()
+    painter.drawPath(path)
+
+    # Label
+    painter.setPen(QPen(Qt.GlobalColor.red, 2))
+    painter.setFont(app_font('Arial', 16, QFont.Weight.Bold))
+    painter.drawText(int(end_x) - 30, int(end_y) - 10,
+                    direction.upper())
+
+    painter.end()
+    _diagram_cache[direction] = pixmap
+    return pixmap
+
+def vertical_diagram(direction):
+    """Return the cached up/down diagram (HackRF body plus vertical arrow)"""
+    pixmap = _diagram_cache.get(direction)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(600, 300)
+    pixmap.fill(Qt.GlobalColor.white)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    center_x, center_y = 300, 150
+
+    # Draw HackRF
+    painter.setBrush(QColor(100, 100, 200))
+    painter.drawRect(center_x - 30, center_y - 20, 60, 40)
+
+    # Draw arrow
+    painter.setPen(QPen(Qt.GlobalColor.red, 4))
+    painter.setBrush(Qt.GlobalColor.red)
+
+    # Up and down arrows differ only in the sign of the vertical offsets;
+    # line and head go down as one path in a single paint call
+    sign = -1 if direction == 'up' else 1
+    path = QPainterPath()
+    path.moveTo(center_x, center_y)
+    path.lineTo(center_x, center_y + sign * 80)
+    path.moveTo(center_x, center_y + sign * 80)
+    path.lineTo(center_x - 15, center_y + sign * 65)
+    path.lineTo(center_x + 15, center_y + sign * 65)
+    path.closeSubpath()
+    painter.drawPath(path)
+
+    painter.end()
+    _diagram_cache[direction] = pixmap
+    return pixmap
+
 class DirectionWidget(QWidget):
     """Widget showing antenna direction with visual diagram"""
-    
+
     def __init__(self, direction, description, angle):
         super().__init__()
         self.direction = direction
@@ -111,7 +912,7 @@ class DirectionWidget(QWidget):
         
         # Title
         title = QLabel(f"Point antenna toward the {self.direction}")
-        title.setFont(QFont('Arial', 18, QFont.Weight.Bold))
+        title.setFont(app_font('Arial', 18, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title.setStyleSheet("color: #ffffff; background-color: #1a1a1a; padding: 10px;")
         layout.addWidget(title)
@@ -124,7 +925,7 @@ class DirectionWidget(QWidget):
         instructions = QLabel(
             "1. Hold your HackRF with antenna pointing in the direction shown above"
         )
-        instructions.setFont(QFont('Arial', 12))
+        instructions.setFont(app_font('Arial', 12))
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         instructions.setStyleSheet("color: #ffffff; padding: 10px; background-color: #2b2b2b;")
         layout.addWidget(instructions)
@@ -134,84 +935,9 @@ class DirectionWidget(QWidget):
     def create_diagram(self):
         """Create visual diagram showing antenna direction"""
         label = QLabel()
-        pixmap = QPixmap(500, 300)
-        pixmap.fill(QColor(43, 43, 43))  # Dark background
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw compass rose
-        center_x, center_y = 250, 150
-        
-        # Draw circle
-        painter.setPen(QPen(Qt.GlobalColor.white, 2))
-        painter.drawEllipse(center_x - 100, center_y - 100, 200, 200)
-        
-        # Draw cardinal directions
-        painter.setPen(QPen(Qt.GlobalColor.white))
-        painter.setFont(QFont('Arial', 14, QFont.Weight.Bold))
-        painter.drawText(center_x - 10, center_y - 110, "N")
-        painter.drawText(center_x - 10, center_y + 125, "S")
-        painter.drawText(center_x + 110, center_y + 5, "E")
-        painter.drawText(center_x - 125, center_y + 5, "W")
-        
-        # Draw intercardinal directions
-        painter.setFont(QFont('Arial', 12))
-        painter.drawText(center_x + 75, center_y - 75, "NE")
-        painter.drawText(center_x + 75, center_y + 85, "SE")
-        painter.drawText(center_x - 95, center_y + 85, "SW")
-        painter.drawText(center_x - 95, center_y - 75, "NW")
-        
-        # Draw HackRF (rectangle in center)
-        hackrf_width, hackrf_height = 60, 40
-        painter.setBrush(QColor(100, 100, 200))
-        painter.drawRect(center_x - hackrf_width//2, center_y - hackrf_height//2, 
-                        hackrf_width, hackrf_height)
-        
-        # Draw antenna direction arrow
-        painter.setPen(QPen(Qt.GlobalColor.red, 4))
-        painter.setBrush(Qt.GlobalColor.red)
-        
-        # Calculate arrow endpoint based on direction
-        import math
-        arrow_length = 80
-        angle_rad = math.radians(self.angle)
-        end_x = center_x + arrow_length * math.sin(angle_rad)
-        end_y = center_y - arrow_length * math.cos(angle_rad)
-        
-        # Draw arrow line
-        painter.drawLine(center_x, center_y, int(end_x), int(end_y))
-        
-        # Draw arrowhead
-        arrow_size = 15
-        angle1 = angle_rad + math.radians(150)
-        angle2 = angle_rad - math.radians(150)
-        
-        point1_x = end_x + arrow_size * math.cos(angle1)
-        point1_y = end_y + arrow_size * math.sin(angle1)
-        point2_x = end_x + arrow_size * math.cos(angle2)
-        point2_y = end_y + arrow_size * math.sin(angle2)
-        
-        from PyQt6.QtGui import QPolygon
-        from PyQt6.QtCore import QPoint
-        
-        arrow_head = QPolygon([
-            QPoint(int(end_x), int(end_y)),
-            QPoint(int(point1_x), int(point1_y)),
-            QPoint(int(point2_x), int(point2_y))
-        ])
-        painter.drawPolygon(arrow_head)
-        
-        # Label
-        painter.setPen(QPen(Qt.GlobalColor.red, 2))
-        painter.setFont(QFont('Arial', 16, QFont.Weight.Bold))
-        painter.drawText(int(end_x) - 30, int(end_y) - 10, 
-                        self.direction.upper())
-        
-        painter.end()
-        label.setPixmap(pixmap)
+        label.setPixmap(direction_diagram(self.direction, self.angle))
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
+
         return label
 
 class HeightDialog(QDialog):
@@ -269,100 +995,37 @@ class StingrayDetectorGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_step = 0
-        self.scan_results = {}
+        self._pass_ts = None  # shared timestamp correlating one scan pass
+        self._probe_thread = None
+        self._last_probe_ts = None  # TTL gate for hackrf_info probes
+        # Schedule path expanded once; its directory is created at startup
+        self._schedule_file = os.path.expanduser(
+            '~/Library/Application Support/EpiRay/schedule.json')
+        os.makedirs(os.path.dirname(self._schedule_file), exist_ok=True)
+        self._schedule_cache = None  # (mtime_ns, parsed schedule dict)
+
+        # Monitoring progress is buffered and drained on a timer so rapid
+        # ticks cost one text insert per interval, not one per message
+        self._pending_msgs = []
+        self._monitor_flush = QTimer(self)
+        self._monitor_flush.setInterval(100)
+        self._monitor_flush.timeout.connect(self.flush_monitor_messages)
         self.antenna_height = 12.0  # Default height
-        self.directions = [
-            ('north', 'Point antenna toward the north', 0),
-            ('south', 'Point antenna toward the south', 180),
-            ('east', 'Point antenna toward the east', 90),
-            ('west', 'Point antenna toward the west', 270),
-            ('southwest', 'Point antenna toward the southwest (lightpole direction)', 225),
-            ('northeast', 'Point antenna toward the northeast (building direction)', 45),
-            ('up', 'Point antenna upward toward the sky', None),
-            ('down', 'Point antenna downward toward the ground', None),
-        ]
+        self.directions = _DIRECTIONS
+        # One slot per direction, filled with a ScanRecord as scans complete
+        self.scan_results = [None] * len(self.directions)
+
+        # Create the scan output directory once instead of per scan
+        os.makedirs(os.path.join(_BASE_DIR, 'detection-logs/directional'), exist_ok=True)
+
         self.setup_ui()
         
     def setup_ui(self):
         self.setWindowTitle('Stingray Detector')
         self.setGeometry(100, 100, 900, 530)
         
-        # Apply dark mode stylesheet
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-            QTextEdit, QLineEdit, QSpinBox, QDoubleSpinBox, QTimeEdit {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 4px;
-                border-radius: 3px;
-            }
-            QProgressBar {
-                background-color: #3d3d3d;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                text-align: center;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-            }
-            QGroupBox {
-                border: 1px solid #555555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                padding: 8px 16px;
-                border: 1px solid #555555;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #2b2b2b;
-                border-bottom: 1px solid #2b2b2b;
-            }
-            QCheckBox {
-                color: #ffffff;
-            }
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: none;
-            }
-        """)
+        # Apply dark mode stylesheet (includes the shared button roles)
+        self.setStyleSheet(_APP_QSS)
         
         # Central widget
         central = QWidget()
@@ -390,18 +1053,7 @@ class StingrayDetectorGUI(QMainWindow):
         
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.clicked.connect(self.check_hackrf_status)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 5px 15px;
-                border-radius: 3px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
+        refresh_btn.setObjectName('refreshAction')
         status_layout.addWidget(refresh_btn)
         
         status_bar.setStyleSheet("background-color: #f5f5f5; border-bottom: 1px solid #ddd;")
@@ -437,57 +1089,24 @@ class StingrayDetectorGUI(QMainWindow):
         self.check_hackrf_status()
         
     def check_hackrf_status(self):
-        """Check if HackRF is connected and accessible"""
-        try:
-            result = subprocess.run(
-                ['hackrf_info'],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            
-            if 'Found HackRF' in result.stdout:
-                if 'Access denied' in result.stdout or 'insufficient permissions' in result.stdout:
-                    self.hackrf_indicator.setText("● Connected (Need Sudo)")
-                    self.hackrf_indicator.setStyleSheet("color: orange; font-size: 16px; font-weight: bold;")
-                    
-                    # Extract serial number
-                    for line in result.stdout.split('\n'):
-                        if 'Serial number:' in line:
-                            serial = line.split(':')[1].strip()
-                            # Mask serial number for privacy (show only last 4 chars)
-                            masked_serial = "XXXXXXXXXXXX" + serial[-4:] if len(serial) > 4 else "XXXX"
-                            self.hackrf_detail.setText(f"Serial: {masked_serial} - Run scripts with sudo for access")
-                            break
-                else:
-                    self.hackrf_indicator.setText("● Connected")
-                    self.hackrf_indicator.setStyleSheet("color: #4caf50; font-size: 16px; font-weight: bold;")
-                    
-                    # Extract serial number
-                    for line in result.stdout.split('\n'):
-                        if 'Serial number:' in line:
-                            serial = line.split(':')[1].strip()
-                            # Mask serial number for privacy (show only last 4 chars)
-                            masked_serial = "XXXXXXXXXXXX" + serial[-4:] if len(serial) > 4 else "XXXX"
-                            self.hackrf_detail.setText(f"Serial: {masked_serial} - Ready to scan")
-                            break
-            else:
-                self.hackrf_indicator.setText("● Not Found")
-                self.hackrf_indicator.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
-                self.hackrf_detail.setText("Connect HackRF via USB and click Refresh")
-                
-        except subprocess.TimeoutExpired:
-            self.hackrf_indicator.setText("● Timeout")
-            self.hackrf_indicator.setStyleSheet("color: orange; font-size: 16px; font-weight: bold;")
-            self.hackrf_detail.setText("HackRF not responding - check connection")
-        except FileNotFoundError:
-            self.hackrf_indicator.setText("● Not Installed")
-            self.hackrf_indicator.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
-            self.hackrf_detail.setText("Install HackRF tools: brew install hackrf")
-        except Exception as e:
-            self.hackrf_indicator.setText("● Error")
-            self.hackrf_indicator.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
-            self.hackrf_detail.setText(str(e))
+        """Probe the HackRF off the GUI thread, coalescing rapid refreshes"""
+        now = time.monotonic()
+        if self._last_probe_ts is not None and now - self._last_probe_ts < 2.0:
+            return  # last probe is fresh; nothing new to learn from USB yet
+        # One long-lived worker, restarted per probe — no thread churn
+        if self._probe_thread is None:
+            self._probe_thread = HackrfProbeThread()
+            self._probe_thread.result.connect(self.hackrf_status_updated)
+        elif self._probe_thread.isRunning():
+            return
+        self._last_probe_ts = now
+        self._probe_thread.start()
+    
+    def hackrf_status_updated(self, text, color, detail):
+        """Apply a completed probe result to the status bar"""
+        self.hackrf_indicator.setText(text)
+        self.hackrf_indicator.setStyleSheet(f"color: {color}; font-size: 16px; font-weight: bold;")
+        self.hackrf_detail.setText(detail)
         
     def create_scanner_tab(self):
         """Create the directional scanner tab"""
@@ -500,21 +1119,20 @@ class StingrayDetectorGUI(QMainWindow):
         self.progress.setValue(0)
         layout.addWidget(self.progress)
         
-        # Stacked widget for direction screens
+        # Stacked widget for direction screens. Only one step is visible at
+        # a time, so each (pixmap-heavy) direction widget is built the first
+        # time its step is shown; until then a bare placeholder holds the slot
         self.stack = QStackedWidget()
-        
-        # Add direction widgets
-        for direction, description, angle in self.directions:
-            if angle is not None:
-                dir_widget = DirectionWidget(direction, description, angle)
-            else:
-                # Special handling for up/down
-                dir_widget = self.create_vertical_widget(direction, description)
-            self.stack.addWidget(dir_widget)
-        
+        self._built_steps = set()
+        for _ in self.directions:
+            self.stack.addWidget(QWidget())
+
         # Add results screen
         self.results_widget = self.create_results_widget()
         self.stack.addWidget(self.results_widget)
+
+        # Materialize the first step for the initial view
+        self.show_step(0)
         
         # Horizontal layout for buttons (left) and visual (right)
         content_layout = QHBoxLayout()
@@ -532,22 +1150,7 @@ class StingrayDetectorGUI(QMainWindow):
         self.scan_btn = QPushButton('Start Scan')
         self.scan_btn.clicked.connect(self.start_scan)
         self.scan_btn.setMinimumHeight(60)
-        self.scan_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-            }
-        """)
+        self.scan_btn.setObjectName('scanAction')
         left_layout.addWidget(self.scan_btn)
         
         self.next_btn = QPushButton('Next →')
@@ -561,7 +1164,7 @@ class StingrayDetectorGUI(QMainWindow):
         # Status label
         self.status_label = QLabel('Ready to start scanning')
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setFont(QFont('Arial', 11))
+        self.status_label.setFont(app_font('Arial', 11))
         self.status_label.setWordWrap(True)
         self.status_label.setStyleSheet("padding: 10px; background-color: #3d3d3d; border-radius: 5px;")
         left_layout.addWidget(self.status_label)
@@ -593,26 +1196,13 @@ class StingrayDetectorGUI(QMainWindow):
             ("2 Hours", 120, 180),
         ]
         
+        self._test_buttons = []
         for i, (label, duration, interval) in enumerate(test_plans):
             btn = QPushButton(f"▶️ {label}\n({interval}s intervals)")
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    font-size: 14px;
-                    padding: 15px;
-                    border-radius: 5px;
-                    min-height: 60px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-                QPushButton:disabled {
-                    background-color: #cccccc;
-                }
-            """)
+            btn.setObjectName('testAction')
             btn.clicked.connect(lambda checked, d=duration, i=interval: self.start_monitoring(d, i))
             test_layout.addWidget(btn, i // 3, i % 3)
+            self._test_buttons.append(btn)
         
         test_group.setLayout(test_layout)
         layout.addWidget(test_group)
@@ -650,18 +1240,7 @@ class StingrayDetectorGUI(QMainWindow):
         # Save button
         save_schedule_btn = QPushButton("💾 Save Schedule")
         save_schedule_btn.clicked.connect(self.save_schedule)
-        save_schedule_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-size: 14px;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
+        save_schedule_btn.setObjectName('saveAction')
         schedule_layout.addRow(save_schedule_btn)
         
         # Info label
@@ -682,6 +1261,8 @@ class StingrayDetectorGUI(QMainWindow):
         # Monitoring status
         self.monitor_status = QTextEdit()
         self.monitor_status.setReadOnly(True)
+        # Cap the backlog so day-long sessions can't grow the layout unbounded
+        self.monitor_status.document().setMaximumBlockCount(5000)
         self.monitor_status.setMaximumHeight(150)
         self.monitor_status.setPlaceholderText("Monitoring status will appear here...")
         layout.addWidget(self.monitor_status)
@@ -690,21 +1271,7 @@ class StingrayDetectorGUI(QMainWindow):
         self.stop_monitor_btn = QPushButton("⏹️ Stop Monitoring")
         self.stop_monitor_btn.clicked.connect(self.stop_monitoring)
         self.stop_monitor_btn.setEnabled(False)
-        self.stop_monitor_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                font-size: 14px;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.stop_monitor_btn.setObjectName('stopAction')
         layout.addWidget(self.stop_monitor_btn)
         
         # Load current schedule
@@ -760,21 +1327,10 @@ class StingrayDetectorGUI(QMainWindow):
         photo_layout.addLayout(measurements_layout)
         
         # Annotate button
-        annotate_btn = QPushButton("🎨 Annotate Photo")
-        annotate_btn.clicked.connect(self.annotate_photo)
-        annotate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9C27B0;
-                color: white;
-                font-size: 16px;
-                padding: 12px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #7B1FA2;
-            }
-        """)
-        photo_layout.addWidget(annotate_btn)
+        self.annotate_btn = QPushButton("🎨 Annotate Photo")
+        self.annotate_btn.clicked.connect(self.annotate_photo)
+        self.annotate_btn.setObjectName('annotateAction')
+        photo_layout.addWidget(self.annotate_btn)
         
         # Preview area
         self.photo_preview = QLabel("Photo preview will appear here")
@@ -806,35 +1362,13 @@ class StingrayDetectorGUI(QMainWindow):
         # GitHub sync button
         github_btn = QPushButton("📤 Upload to GitHub Community")
         github_btn.clicked.connect(self.upload_to_github)
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #24292e;
-                color: white;
-                font-size: 16px;
-                padding: 15px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #1b1f23;
-            }
-        """)
+        github_btn.setObjectName('githubAction')
         github_layout.addWidget(github_btn)
         
         # View community button
         view_community_btn = QPushButton("👀 View Community Reports")
         view_community_btn.clicked.connect(self.view_community_reports)
-        view_community_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0366d6;
-                color: white;
-                font-size: 14px;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #0256c7;
-            }
-        """)
+        view_community_btn.setObjectName('communityAction')
         github_layout.addWidget(view_community_btn)
         
         github_group.setLayout(github_layout)
@@ -849,59 +1383,19 @@ class StingrayDetectorGUI(QMainWindow):
         
         # Title
         title = QLabel(f"Point Antenna: {direction.upper()}")
-        title.setFont(QFont('Arial', 24, QFont.Weight.Bold))
+        title.setFont(app_font('Arial', 24, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Description
         desc = QLabel(description)
-        desc.setFont(QFont('Arial', 14))
+        desc.setFont(app_font('Arial', 14))
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(desc)
         
-        # Simple diagram
+        # Simple diagram, shared across rebuilds
         diagram_label = QLabel()
-        pixmap = QPixmap(600, 300)
-        pixmap.fill(Qt.GlobalColor.white)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        center_x, center_y = 300, 150
-        
-        # Draw HackRF
-        painter.setBrush(QColor(100, 100, 200))
-        painter.drawRect(center_x - 30, center_y - 20, 60, 40)
-        
-        # Draw arrow
-        painter.setPen(QPen(Qt.GlobalColor.red, 4))
-        painter.setBrush(Qt.GlobalColor.red)
-        
-        if direction == 'up':
-            # Arrow pointing up
-            painter.drawLine(center_x, center_y, center_x, center_y - 80)
-            from PyQt6.QtGui import QPolygon
-            from PyQt6.QtCore import QPoint
-            arrow = QPolygon([
-                QPoint(center_x, center_y - 80),
-                QPoint(center_x - 15, center_y - 65),
-                QPoint(center_x + 15, center_y - 65)
-            ])
-            painter.drawPolygon(arrow)
-        else:
-            # Arrow pointing down
-            painter.drawLine(center_x, center_y, center_x, center_y + 80)
-            from PyQt6.QtGui import QPolygon
-            from PyQt6.QtCore import QPoint
-            arrow = QPolygon([
-                QPoint(center_x, center_y + 80),
-                QPoint(center_x - 15, center_y + 65),
-                QPoint(center_x + 15, center_y + 65)
-            ])
-            painter.drawPolygon(arrow)
-        
-        painter.end()
-        diagram_label.setPixmap(pixmap)
+        diagram_label.setPixmap(vertical_diagram(direction))
         diagram_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(diagram_label)
         
@@ -911,7 +1405,7 @@ class StingrayDetectorGUI(QMainWindow):
             "2. Keep antenna steady\n"
             "3. Click 'Start Scan' when ready"
         )
-        instructions.setFont(QFont('Arial', 12))
+        instructions.setFont(app_font('Arial', 12))
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         instructions.setStyleSheet("color: #ffffff; padding: 10px; background-color: #2b2b2b;")
         layout.addWidget(instructions)
@@ -925,13 +1419,14 @@ class StingrayDetectorGUI(QMainWindow):
         layout = QVBoxLayout()
         
         title = QLabel('Scan Complete!')
-        title.setFont(QFont('Arial', 24, QFont.Weight.Bold))
+        title.setFont(app_font('Arial', 24, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
-        self.results_text.setFont(QFont('Courier', 11))
+        self.results_text.document().setMaximumBlockCount(5000)
+        self.results_text.setFont(app_font('Courier', 11))
         layout.addWidget(self.results_text)
         
         # Button layout
@@ -940,95 +1435,101 @@ class StingrayDetectorGUI(QMainWindow):
         # Set height button
         height_btn = QPushButton('Set Antenna Height')
         height_btn.clicked.connect(self.set_antenna_height)
-        height_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                font-size: 14px;
-                padding: 8px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
+        height_btn.setObjectName('heightAction')
         btn_layout.addWidget(height_btn)
         
         # Analyze button
-        analyze_btn = QPushButton('Analyze Results')
-        analyze_btn.clicked.connect(self.analyze_results)
-        analyze_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-size: 16px;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
-        btn_layout.addWidget(analyze_btn)
+        self.analyze_btn = QPushButton('Analyze Results')
+        self.analyze_btn.clicked.connect(self.analyze_results)
+        self.analyze_btn.setObjectName('analyzeAction')
+        btn_layout.addWidget(self.analyze_btn)
         
         layout.addLayout(btn_layout)
         
         widget.setLayout(layout)
         return widget
         
+    def show_step(self, index):
+        """Show a scan step, building its direction widget on first view"""
+        if index < len(self.directions) and index not in self._built_steps:
+            step = self.directions[index]
+            if step.angle is not None:
+                dir_widget = DirectionWidget(step.name, step.description, step.angle)
+            else:
+                # Special handling for up/down
+                dir_widget = self.create_vertical_widget(step.name, step.description)
+            placeholder = self.stack.widget(index)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stack.insertWidget(index, dir_widget)
+            self._built_steps.add(index)
+        self.stack.setCurrentIndex(index)
+
+    def _set_nav_state(self, *, scan, prev, nxt):
+        """Set the scan/prev/next button trio in one place
+
+        Every scan and navigation slot toggles the same three buttons;
+        funneling them through one helper keeps the states consistent and
+        leaves a single spot to audit.
+        """
+        self.scan_btn.setEnabled(scan)
+        self.prev_btn.setEnabled(prev)
+        self.next_btn.setEnabled(nxt)
+
     def start_scan(self):
         """Start scanning current direction"""
-        self.scan_btn.setEnabled(False)
-        self.prev_btn.setEnabled(False)
-        self.next_btn.setEnabled(False)
+        self._set_nav_state(scan=False, prev=False, nxt=False)
         
-        direction = self.directions[self.current_step][0]
+        direction = self.directions[self.current_step].name
         self.status_label.setText(f'Scanning {direction}... Please wait...')
         
+        # One timestamp per pass, so the eight directional files correlate
+        if self.current_step == 0 or self._pass_ts is None:
+            self._pass_ts = time.strftime(_TS_FMT)
+        
         # Start scan thread
-        self.scan_thread = ScanThread(direction)
+        self.scan_thread = ScanThread(direction, self._pass_ts)
+        self.scan_thread.progress.connect(self.status_label.setText)
         self.scan_thread.finished.connect(self.scan_finished)
         self.scan_thread.error.connect(self.scan_error)
         self.scan_thread.start()
         
     def scan_finished(self, direction, output_file):
         """Handle scan completion"""
-        self.scan_results[direction] = output_file
+        self.scan_results[self.current_step] = ScanRecord(
+            direction=direction,
+            filepath=output_file,
+            timestamp=self._pass_ts,
+            ok=True,
+        )
         self.status_label.setText(f'✅ {direction.upper()} scan complete!')
-        self.next_btn.setEnabled(True)
-        self.scan_btn.setEnabled(False)
+        self._set_nav_state(scan=False, prev=False, nxt=True)
         
         # Auto-advance after 1 second
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(1000, self.next_step)
         
     def scan_error(self, error_msg):
         """Handle scan error"""
         self.status_label.setText(f'❌ Error: {error_msg}')
-        self.scan_btn.setEnabled(True)
-        self.prev_btn.setEnabled(self.current_step > 0)
+        self._set_nav_state(scan=True, prev=self.current_step > 0, nxt=False)
         QMessageBox.critical(self, 'Scan Error', f'Failed to scan:\n{error_msg}')
         
     def next_step(self):
         """Move to next direction"""
         if self.current_step < len(self.directions) - 1:
             self.current_step += 1
-            self.stack.setCurrentIndex(self.current_step)
+            self.show_step(self.current_step)
             self.progress.setValue(self.current_step)
-            self.prev_btn.setEnabled(True)
-            self.scan_btn.setEnabled(True)
-            self.next_btn.setEnabled(False)
-            
-            direction = self.directions[self.current_step][0]
+            self._set_nav_state(scan=True, prev=True, nxt=False)
+
+            direction = self.directions[self.current_step].name
             self.status_label.setText(f'Ready to scan {direction}')
         else:
             # All scans complete, show results
             self.current_step += 1
             self.stack.setCurrentIndex(len(self.directions))
             self.progress.setValue(len(self.directions))
-            self.prev_btn.setEnabled(True)
-            self.next_btn.setEnabled(False)
-            self.scan_btn.setEnabled(False)
+            self._set_nav_state(scan=False, prev=True, nxt=False)
             self.status_label.setText('All scans complete!')
             self.show_results_summary()
             
@@ -1036,13 +1537,11 @@ class StingrayDetectorGUI(QMainWindow):
         """Move to previous direction"""
         if self.current_step > 0:
             self.current_step -= 1
-            self.stack.setCurrentIndex(self.current_step)
+            self.show_step(self.current_step)
             self.progress.setValue(self.current_step)
-            self.prev_btn.setEnabled(self.current_step > 0)
-            self.next_btn.setEnabled(True)
-            self.scan_btn.setEnabled(True)
+            self._set_nav_state(scan=True, prev=self.current_step > 0, nxt=True)
             
-            direction = self.directions[self.current_step][0]
+            direction = self.directions[self.current_step].name
             self.status_label.setText(f'Ready to scan {direction}')
             
     def set_antenna_height(self):
@@ -1060,12 +1559,13 @@ class StingrayDetectorGUI(QMainWindow):
     
     def show_results_summary(self):
         """Display summary of all scans"""
+        completed = [r for r in self.scan_results if r is not None]
         summary = "=== Directional Scan Summary ===\n\n"
-        summary += f"Total scans completed: {len(self.scan_results)}\n"
+        summary += f"Total scans completed: {len(completed)}\n"
         summary += f"Antenna height: {self.antenna_height:.1f} feet\n\n"
         
-        for direction, filepath in self.scan_results.items():
-            summary += f"✅ {direction.upper()}: {filepath}\n"
+        for record in completed:
+            summary += f"✅ {record.direction.upper()}: {record.filepath}\n"
         
         summary += "\n\nClick 'Set Antenna Height' to adjust height if needed."
         summary += "\nClick 'Analyze Results' to run full analysis and triangulation."
@@ -1074,159 +1574,124 @@ class StingrayDetectorGUI(QMainWindow):
         
     def analyze_results(self):
         """Run analysis scripts on collected data"""
-        if len(self.scan_results) < 4:
+        if sum(r is not None for r in self.scan_results) < 4:
             QMessageBox.warning(
                 self,
                 'Insufficient Data',
                 'Please complete at least 4 directional scans before analyzing.'
             )
             return
-        
-        self.results_text.append("\n\n=== Running Analysis ===\n")
-        self.results_text.append(f"Using antenna height: {self.antenna_height:.1f} feet\n\n")
-        QApplication.processEvents()
-        
-        try:
-            # Run comparison script
-            self.results_text.append("Running directional comparison...\n")
-            QApplication.processEvents()
-            
-            result = subprocess.run(
-                ['python3', 'scripts/compare-directions.py', 'detection-logs/directional/'],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__)),
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                self.results_text.append(result.stdout)
-            else:
-                self.results_text.append(f"⚠️ Comparison script error:\n{result.stderr}\n")
-            
-            # Run position estimation
-            self.results_text.append("\n\n=== Position Estimation ===\n")
-            QApplication.processEvents()
-            
-            result = subprocess.run(
-                ['python3', 'scripts/estimate-position.py', 
-                 'detection-logs/directional/', str(self.antenna_height)],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__)),
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                self.results_text.append(result.stdout)
-                self.status_label.setText('✅ Analysis complete!')
-                QMessageBox.information(
-                    self,
-                    'Analysis Complete',
-                    'Directional analysis and position estimation complete!\n\n'
-                    'Check the results above for signal source location.'
-                )
-            else:
-                self.results_text.append(f"⚠️ Position estimation error:\n{result.stderr}\n")
-                self.status_label.setText('⚠️ Analysis completed with warnings')
-            
-        except subprocess.TimeoutExpired:
-            self.results_text.append("\n\n❌ Error: Analysis timed out (took longer than 30 seconds)")
-            self.status_label.setText('❌ Analysis timed out')
-            QMessageBox.critical(
-                self,
-                'Timeout Error',
-                'Analysis took too long and was cancelled.\n\n'
-                'This may indicate an issue with the scan data or analysis scripts.'
-            )
-        except FileNotFoundError as e:
-            self.results_text.append(f"\n\n❌ Error: Required file not found\n{str(e)}")
-            self.status_label.setText('❌ Analysis failed')
-            QMessageBox.critical(
-                self,
-                'File Error',
-                f'Could not find required files:\n{str(e)}\n\n'
-                'Make sure all scan files are in detection-logs/directional/'
-            )
-        except Exception as e:
-            self.results_text.append(f"\n\n❌ Unexpected error: {str(e)}\n")
-            self.status_label.setText('❌ Analysis failed')
-            QMessageBox.critical(
-                self,
-                'Error',
-                f'An error occurred during analysis:\n{str(e)}'
-            )
+
+        append_log(self.results_text, "\n\n=== Running Analysis ===\n")
+        append_log(self.results_text, f"Using antenna height: {self.antenna_height:.1f} feet\n\n")
+
+        # The scripts run off the GUI thread; signals stream their output
+        # back, so no processEvents polling is needed to stay responsive.
+        # The button stays disabled until the thread finishes — reassigning
+        # analyze_thread mid-run would destroy a running QThread
+        self.analyze_btn.setEnabled(False)
+        self.analyze_thread = AnalyzeThread(self.antenna_height)
+        self.analyze_thread.progress.connect(self.append_result)
+        self.analyze_thread.finished.connect(self.analysis_finished)
+        self.analyze_thread.start()
+
+    def append_result(self, text):
+        """Append a chunk of analysis output to the results pane"""
+        append_log(self.results_text, text)
+
+    def analysis_finished(self, success, status, message):
+        """Handle analysis completion"""
+        self.analyze_btn.setEnabled(True)
+        self.status_label.setText(status)
+
+        if success:
+            QMessageBox.information(self, 'Analysis Complete', message)
+        elif message:
+            QMessageBox.critical(self, 'Analysis Error', message)
 
     def start_monitoring(self, duration_minutes, interval_seconds):
         """Start monitoring test"""
-        self.monitor_status.append(f"\n[{datetime.now().strftime('%H:%M:%S')}] Starting {duration_minutes} minute monitoring...")
+        append_log(self.monitor_status, f"\n[{time.strftime('%H:%M:%S')}] Starting {duration_minutes} minute monitoring...")
         self.stop_monitor_btn.setEnabled(True)
         
         # Disable test buttons
-        for btn in self.findChildren(QPushButton):
-            if "▶️" in btn.text():
-                btn.setEnabled(False)
+        for btn in self._test_buttons:
+            btn.setEnabled(False)
         
         # Start monitoring thread
         self.monitor_thread = MonitorThread(duration_minutes, interval_seconds)
         self.monitor_thread.progress.connect(self.monitor_progress)
         self.monitor_thread.finished.connect(self.monitor_finished)
         self.monitor_thread.start()
+        self._monitor_flush.start()
         
     def monitor_progress(self, message):
-        """Update monitoring progress"""
-        self.monitor_status.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        """Queue a monitoring progress message for the next flush"""
+        self._pending_msgs.append(f"[{time.strftime('%H:%M:%S')}] {message}")
+        
+    def flush_monitor_messages(self):
+        """Drain queued progress messages into the status pane in one insert"""
+        if self._pending_msgs:
+            append_log(self.monitor_status, "\n".join(self._pending_msgs))
+            self._pending_msgs.clear()
         
     def monitor_finished(self, success, message):
         """Handle monitoring completion"""
+        self._monitor_flush.stop()
+        self.flush_monitor_messages()
         if success:
-            self.monitor_status.append(f"\n✅ [{datetime.now().strftime('%H:%M:%S')}] {message}")
-            QMessageBox.information(self, 'Monitoring Complete', message)
+            if message:  # empty on a user-requested stop, already logged
+                append_log(self.monitor_status, f"\n✅ [{time.strftime('%H:%M:%S')}] {message}")
+                QMessageBox.information(self, 'Monitoring Complete', message)
         else:
-            self.monitor_status.append(f"\n❌ [{datetime.now().strftime('%H:%M:%S')}] {message}")
+            append_log(self.monitor_status, f"\n❌ [{time.strftime('%H:%M:%S')}] {message}")
             QMessageBox.warning(self, 'Monitoring Failed', message)
         
         self.stop_monitor_btn.setEnabled(False)
         
         # Re-enable test buttons
-        for btn in self.findChildren(QPushButton):
-            if "▶️" in btn.text():
-                btn.setEnabled(True)
+        for btn in self._test_buttons:
+            btn.setEnabled(True)
                 
     def stop_monitoring(self):
         """Stop current monitoring"""
         if hasattr(self, 'monitor_thread') and self.monitor_thread.isRunning():
-            # Kill HackRF processes
-            subprocess.run(['killall', 'hackrf_sweep'], stderr=subprocess.DEVNULL)
-            subprocess.run(['killall', 'track-movement.sh'], stderr=subprocess.DEVNULL)
-            self.monitor_thread.terminate()
-            self.monitor_thread.wait()
-            self.monitor_status.append(f"\n⏹️ [{datetime.now().strftime('%H:%M:%S')}] Monitoring stopped by user")
+            # Kill the tracking script and its HackRF children directly.
+            # No wait() here: the thread notices its child exiting and
+            # emits finished, which re-enables the buttons — the event
+            # loop stays free during teardown.
+            self.monitor_thread.stop()
+            append_log(self.monitor_status, f"\n⏹️ [{time.strftime('%H:%M:%S')}] Monitoring stopped by user")
             self.stop_monitor_btn.setEnabled(False)
-            
-            # Re-enable test buttons
-            for btn in self.findChildren(QPushButton):
-                if "▶️" in btn.text():
-                    btn.setEnabled(True)
                     
     def load_schedule(self):
         """Load schedule from file"""
-        schedule_file = os.path.expanduser('~/Library/Application Support/EpiRay/schedule.json')
-        if os.path.exists(schedule_file):
-            try:
+        schedule_file = self._schedule_file
+        try:
+            mtime = os.stat(schedule_file).st_mtime_ns
+        except OSError:
+            return  # no schedule saved yet
+
+        try:
+            # Re-parse only when the file actually changed on disk
+            if self._schedule_cache is not None and self._schedule_cache[0] == mtime:
+                schedule = self._schedule_cache[1]
+            else:
                 with open(schedule_file, 'r') as f:
                     schedule = json.load(f)
-                    self.schedule_enabled.setChecked(schedule.get('enabled', False))
-                    
-                    # Parse time
-                    time_str = schedule.get('daily_time', '20:00')
-                    hour, minute = map(int, time_str.split(':'))
-                    self.schedule_time.setTime(QTime(hour, minute))
-                    
-                    self.schedule_duration.setValue(schedule.get('duration_minutes', 60))
-                    self.schedule_interval.setValue(schedule.get('interval_seconds', 120))
-            except Exception as e:
-                print(f"Error loading schedule: {e}")
+                self._schedule_cache = (mtime, schedule)
+
+            self.schedule_enabled.setChecked(schedule.get('enabled', False))
+            
+            # Parse time
+            time_str = schedule.get('daily_time', '20:00')
+            hour, minute = map(int, time_str.split(':'))
+            self.schedule_time.setTime(QTime(hour, minute))
+            
+            self.schedule_duration.setValue(schedule.get('duration_minutes', 60))
+            self.schedule_interval.setValue(schedule.get('interval_seconds', 120))
+        except Exception as e:
+            print(f"Error loading schedule: {e}")
                 
     def save_schedule(self):
         """Save schedule to file"""
@@ -1237,25 +1702,33 @@ class StingrayDetectorGUI(QMainWindow):
             'interval_seconds': self.schedule_interval.value()
         }
         
-        schedule_file = os.path.expanduser('~/Library/Application Support/EpiRay/schedule.json')
-        os.makedirs(os.path.dirname(schedule_file), exist_ok=True)
+        # File I/O runs on the global thread pool; the event loop never
+        # blocks on the disk and the result comes back through a signal
+        task = _ScheduleSaveTask(self._schedule_file, schedule)
+        task.signals.done.connect(self.schedule_saved)
+        self._save_task = task  # keep the signal holder alive until done
+        QThreadPool.globalInstance().start(task)
+    
+    def schedule_saved(self, success, mtime_ns, error):
+        """Handle completion of a background schedule save"""
+        if not success:
+            QMessageBox.critical(self, 'Error', f'Failed to save schedule:\n{error}')
+            return
         
-        try:
-            with open(schedule_file, 'w') as f:
-                json.dump(schedule, f, indent=2)
-            
-            QMessageBox.information(
-                self,
-                'Schedule Saved',
-                f"Schedule saved successfully!\n\n"
-                f"{'Enabled' if schedule['enabled'] else 'Disabled'}\n"
-                f"Daily run time: {schedule['daily_time']}\n"
-                f"Duration: {schedule['duration_minutes']} minutes\n"
-                f"Interval: {schedule['interval_seconds']} seconds\n\n"
-                f"The scheduler daemon will run this automatically."
-            )
-        except Exception as e:
-            QMessageBox.critical(self, 'Error', f'Failed to save schedule:\n{str(e)}')
+        schedule = self._save_task.schedule
+        # Seed the cache from the dict just written — no re-read needed
+        self._schedule_cache = (mtime_ns, schedule)
+        
+        QMessageBox.information(
+            self,
+            'Schedule Saved',
+            f"Schedule saved successfully!\n\n"
+            f"{'Enabled' if schedule['enabled'] else 'Disabled'}\n"
+            f"Daily run time: {schedule['daily_time']}\n"
+            f"Duration: {schedule['duration_minutes']} minutes\n"
+            f"Interval: {schedule['interval_seconds']} seconds\n\n"
+            f"The scheduler daemon will run this automatically."
+        )
     
     def select_photo(self):
         """Open file dialog to select photo"""
@@ -1268,20 +1741,24 @@ class StingrayDetectorGUI(QMainWindow):
         
         if file_path:
             self.photo_path_input.setText(file_path)
-            
-            # Show preview
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                # Scale to fit preview
-                scaled = pixmap.scaled(800, 600, Qt.AspectRatioMode.KeepAspectRatio, 
-                                      Qt.TransformationMode.SmoothTransformation)
-                self.photo_preview.setPixmap(scaled)
-    
+            self.show_preview(file_path)
+
+    def show_preview(self, path):
+        """Load and scale a photo for the preview pane off the GUI thread"""
+        task = _PreviewLoadTask(path)
+        task.signals.ready.connect(self.preview_ready)
+        self._preview_task = task  # hold the signal carrier until done
+        QThreadPool.globalInstance().start(task)
+
+    def preview_ready(self, image):
+        if not image.isNull():
+            self.photo_preview.setPixmap(QPixmap.fromImage(image))
+
     def annotate_photo(self):
         """Annotate the selected photo with measurements"""
         photo_path = self.photo_path_input.text()
-        
-        if not photo_path or not os.path.exists(photo_path):
+
+        if not photo_path:
             QMessageBox.warning(self, 'No Photo', 'Please select a photo first.')
             return
         
@@ -1302,81 +1779,29 @@ class StingrayDetectorGUI(QMainWindow):
                               'Please enter at least one measurement.')
             return
         
-        try:
-            # Generate output path
-            base_name = os.path.splitext(photo_path)[0]
-            output_path = f"{base_name}_annotated.jpg"
-            
-            # Annotate using PIL
-            img = Image.open(photo_path)
-            draw = ImageDraw.Draw(img)
-            
-            width, height = img.size
-            
-            # Load font
-            try:
-                title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-                label_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-                data_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 35)
-            except:
-                title_font = ImageFont.load_default()
-                label_font = ImageFont.load_default()
-                data_font = ImageFont.load_default()
-            
-            # Top overlay
-            overlay = Image.new('RGBA', (width, 200), (0, 0, 0, 180))
-            img.paste(overlay, (0, 0), overlay)
-            
-            # Title
-            draw.text((20, 20), f"🎯 {measurements['species']}", 
-                     fill=(255, 255, 255), font=title_font)
-            
-            # Measurements
-            y = 90
-            if measurements['distance']:
-                draw.text((20, y), f"📏 Distance: {measurements['distance']}", 
-                         fill=(255, 200, 0), font=label_font)
-                y += 50
-            
-            if measurements['direction']:
-                draw.text((20, y), f"🧭 Direction: {measurements['direction']}", 
-                         fill=(255, 200, 0), font=label_font)
-            
-            # Bottom overlay
-            info_overlay = Image.new('RGBA', (width, 150), (0, 0, 0, 180))
-            img.paste(info_overlay, (0, height - 150), info_overlay)
-            
-            # Bottom info
-            y_bottom = height - 130
-            if measurements['height']:
-                draw.text((20, y_bottom), f"📐 Height: {measurements['height']}", 
-                         fill=(100, 200, 255), font=data_font)
-                y_bottom += 45
-            
-            if measurements['signal_strength']:
-                draw.text((20, y_bottom), f"📡 Signal: {measurements['signal_strength']}", 
-                         fill=(255, 100, 100), font=data_font)
-            
-            # Save
-            img.save(output_path, quality=95)
-            
-            # Show result
-            QMessageBox.information(
-                self,
-                'Success!',
-                f'Annotated photo saved to:\n{output_path}\n\n'
-                f'You can now upload this to the community!'
-            )
-            
-            # Update preview
-            pixmap = QPixmap(output_path)
-            scaled = pixmap.scaled(800, 600, Qt.AspectRatioMode.KeepAspectRatio,
-                                  Qt.TransformationMode.SmoothTransformation)
-            self.photo_preview.setPixmap(scaled)
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Error', f'Failed to annotate photo:\n{str(e)}')
-    
+        # Decode, draw and encode on the pool — a large photo would freeze
+        # the event loop for seconds if annotated here
+        self.annotate_btn.setEnabled(False)
+        task = _AnnotateTask(photo_path, measurements)
+        task.signals.done.connect(self.annotation_done)
+        task.signals.error.connect(self.annotation_failed)
+        self._annotate_task = task  # hold the signal carrier until done
+        QThreadPool.globalInstance().start(task)
+
+    def annotation_done(self, output_path, preview):
+        self.annotate_btn.setEnabled(True)
+        self.preview_ready(preview)
+        QMessageBox.information(
+            self,
+            'Success!',
+            f'Annotated photo saved to:\n{output_path}\n\n'
+            f'You can now upload this to the community!'
+        )
+
+    def annotation_failed(self, message):
+        self.annotate_btn.setEnabled(True)
+        QMessageBox.critical(self, 'Error', message)
+
     def upload_to_github(self):
         """Open GitHub to upload report"""
         msg = QMessageBox()
@@ -4,296 +4,502 @@ Stingray Map - Track and visualize all detected Stingrays
 Like Pokemon Go, but for surveillance devices!
 """
 
+import atexit
+import functools
 import json
 import os
-import shutil
+import re
+import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 
-STINGRAY_DB = os.path.expanduser('~/Library/Application Support/EpiRay/stingray_catches.json')
+STINGRAY_DB = os.path.expanduser('~/Library/Application Support/EpiRay/stingray_catches.db')
+# Pre-SQLite catch file; imported once into the database, then left renamed
+LEGACY_JSON_DB = os.path.expanduser('~/Library/Application Support/EpiRay/stingray_catches.json')
 PHOTO_DIR = os.path.expanduser('~/Library/Application Support/EpiRay/photos')
 
 # Stingray species names based on location/characteristics
 SPECIES_NAMES = {
-    'lightpole': ['LightPolaflag', 'PoleMon', 'FlagPole', 'StreetLightray'],
-    'vehicle': ['VanRay', 'TruckMon', 'CarStingray', 'MobileRay'],
-    'building': ['RoofTopRay', 'BuildingMon', 'WallStingray', 'StructureRay'],
-    'utility': ['UtilityBoxRay', 'TransformerMon', 'CabinetStingray'],
-    'portable': ['BackpackRay', 'PortableMon', 'HandheldStingray'],
-    'ground': ['GroundRay', 'BaseMon', 'FloorStingray'],
-    'unknown': ['MysteryRay', 'UnknownMon', 'ShadowStingray', 'PhantomRay']
+    'lightpole': ('LightPolaflag', 'PoleMon', 'FlagPole', 'StreetLightray'),
+    'vehicle': ('VanRay', 'TruckMon', 'CarStingray', 'MobileRay'),
+    'building': ('RoofTopRay', 'BuildingMon', 'WallStingray', 'StructureRay'),
+    'utility': ('UtilityBoxRay', 'TransformerMon', 'CabinetStingray'),
+    'portable': ('BackpackRay', 'PortableMon', 'HandheldStingray'),
+    'ground': ('GroundRay', 'BaseMon', 'FloorStingray'),
+    'unknown': ('MysteryRay', 'UnknownMon', 'ShadowStingray', 'PhantomRay')
 }
 
+# Only the first name per category is ever assigned; fold the [0] lookups
+# into a flat table at import
+_CANONICAL_SPECIES = {category: names[0] for category, names in SPECIES_NAMES.items()}
+
+# Every location keyword in one alternation: a single scan replaces the
+# former cascade of ~15 substring searches. 'pole' alone covers the
+# lightpole/light pole spellings; category priority is applied after the
+# scan so "van near lightpole" still classifies as lightpole.
+_SPECIES_RE = re.compile(
+    r'(?P<lightpole>pole)|'
+    r'(?P<vehicle>vehicle|van|car|truck)|'
+    r'(?P<building>building|roof|wall)|'
+    r'(?P<utility>utility|box|cabinet)|'
+    r'(?P<portable>backpack|portable)',
+    re.IGNORECASE)
+_SPECIES_PRIORITY = ('lightpole', 'vehicle', 'building', 'utility', 'portable')
+_GROUND_RE = re.compile(r'ground|floor', re.IGNORECASE)
+_FLAG_RE = re.compile(r'flag', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
+def _species_for(location, device_type, position):
+    """Classify a catch into a species from its description
+
+    Fixed stingrays get re-sighted at the same spot over and over, so the
+    cache turns repeat classifications into a hash probe.
+    """
+    position = position or ""
+
+    found = {m.lastgroup for m in _SPECIES_RE.finditer(location)}
+    for category in _SPECIES_PRIORITY:
+        if category in found:
+            if category == 'lightpole' and (
+                    _FLAG_RE.search(location) or _FLAG_RE.search(position)):
+                return 'LightPolaflag'
+            return _CANONICAL_SPECIES[category]
+    if _GROUND_RE.search(position):
+        return _CANONICAL_SPECIES['ground']
+    return _CANONICAL_SPECIES['unknown']
+
+def copy_photo(src, dest):
+    """Copy a photo into the collection, cloning instead of copying bytes
+
+    On APFS, cp -c makes a copy-on-write clone — O(1) metadata work no
+    matter how large the photo is. Anywhere cloning isn't supported
+    (other filesystems, cross-device moves) the plain copy still lands.
+
+    subprocess and shutil are imported here so the common list/stats/seen
+    invocations never pay their module load at CLI startup.
+    """
+    import subprocess
+    if sys.platform == 'darwin':
+        try:
+            subprocess.run(['cp', '-c', src, dest],
+                           check=True, capture_output=True)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    import shutil
+    shutil.copy2(src, dest)
+
+def store_photo(photo_path):
+    """Import a photo into the collection under its content hash
+
+    The stored name is the blake2b digest of the bytes, so the same photo
+    attached to several catches lands on disk once — re-imports reduce to
+    a hash plus one stat. Returns the stored filename, or None when the
+    photo can't be read.
+    """
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        # Open directly instead of a pre-flight exists() check; hash in
+        # 1 MiB chunks so large photos never sit in memory whole
+        with open(photo_path, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+    except OSError:
+        return None
+
+    ext = os.path.splitext(photo_path)[1]
+    photo_filename = f"stingray_{digest.hexdigest()}{ext}"
+    dest = os.path.join(PHOTO_DIR, photo_filename)
+    if not os.path.exists(dest):
+        copy_photo(photo_path, dest)
+    return photo_filename
+
+# Per-catch pokedex block, parsed once; format_map reuses the compiled
+# template instead of re-interpolating eight f-strings per catch
+_CATCH_TMPL = (
+    "\n   #{id}: {nickname}"
+    "\n   Species: {species}"
+    "\n   Type: {device_type_upper}"
+    "\n   Location: {location}"
+    "\n   Signal: {signal_strength} dBm"
+    "\n   Sightings: {sightings}"
+    "{photo_line}"
+    "\n   First Seen: {first_seen}"
+    "\n   Last Seen: {last_seen_short}")
+
 class StingrayTracker:
     """Track detected Stingrays like Pokemon"""
     
     def __init__(self):
-        self.ensure_db()
-        self.catches = self.load_catches()
-        
+        self.conn = self.ensure_db()
+        # Close at exit so the WAL checkpoints instead of lingering
+        atexit.register(self.close)
+
+    def close(self):
+        """Close the catch database (safe to call more than once)"""
+        self.conn.close()
+
     def ensure_db(self):
-        """Ensure database directory exists"""
+        """Open the catch database, creating schema and dirs as needed
+
+        Every mutation used to rewrite the whole JSON file; rows in SQLite
+        keep each catch/seen/gone write proportional to the change, and the
+        primary key replaces the linear id scans. WAL lets list/stats read
+        while a writer commits.
+        """
         os.makedirs(os.path.dirname(STINGRAY_DB), exist_ok=True)
         os.makedirs(PHOTO_DIR, exist_ok=True)
-        if not os.path.exists(STINGRAY_DB):
-            with open(STINGRAY_DB, 'w') as f:
-                json.dump({'catches': [], 'stats': {'total': 0, 'mobile': 0, 'fixed': 0}}, f)
-    
-    def load_catches(self):
-        """Load all caught Stingrays"""
-        with open(STINGRAY_DB, 'r') as f:
-            return json.load(f)
-    
-    def save_catches(self):
-        """Save catches to database"""
-        with open(STINGRAY_DB, 'w') as f:
-            json.dump(self.catches, f, indent=2)
-    
+
+        conn = sqlite3.connect(STINGRAY_DB)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=67108864')
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS catches(
+                id INTEGER PRIMARY KEY,
+                nickname TEXT,
+                species TEXT,
+                caught_date TEXT,
+                location TEXT,
+                position TEXT,
+                signal_strength REAL,
+                device_type TEXT,
+                photo TEXT,
+                frequencies TEXT DEFAULT '[]',
+                sightings INTEGER DEFAULT 1,
+                last_seen TEXT,
+                status TEXT DEFAULT 'active'
+            );
+            CREATE INDEX IF NOT EXISTS idx_catches_status ON catches(status);
+            CREATE TABLE IF NOT EXISTS stats(key TEXT PRIMARY KEY, value INTEGER);
+        ''')
+        conn.executemany(
+            'INSERT OR IGNORE INTO stats(key, value) VALUES(?, 0)',
+            [('total',), ('mobile',), ('fixed',)])
+        conn.commit()
+
+        self.migrate_legacy_json(conn)
+        return conn
+
+    def migrate_legacy_json(self, conn):
+        """One-time import of the old stingray_catches.json, if present"""
+        if not os.path.exists(LEGACY_JSON_DB):
+            return
+        try:
+            with open(LEGACY_JSON_DB, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        with conn:
+            for catch in legacy.get('catches', []):
+                conn.execute('''
+                    INSERT OR IGNORE INTO catches(id, nickname, species, caught_date,
+                        location, position, signal_strength, device_type, photo,
+                        frequencies, sightings, last_seen, status)
+                    VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)
+                ''', (catch['id'], catch['nickname'], catch.get('species'),
+                      catch['caught_date'], catch['location'], catch['position'],
+                      catch['signal_strength'], catch['device_type'],
+                      catch.get('photo'), json.dumps(catch.get('frequencies', [])),
+                      catch.get('sightings', 1), catch['last_seen'],
+                      catch.get('status', 'active')))
+            for key, value in legacy.get('stats', {}).items():
+                conn.execute('UPDATE stats SET value = ? WHERE key = ?', (value, key))
+        os.rename(LEGACY_JSON_DB, LEGACY_JSON_DB + '.migrated')
+
+    @staticmethod
+    def row_to_catch(row):
+        """Convert a catches row to the dict shape the CLI always used"""
+        catch = dict(row)
+        catch['frequencies'] = json.loads(catch['frequencies'] or '[]')
+        return catch
+
     def generate_species_name(self, location, device_type, position):
         """Generate a Pokemon-style species name based on characteristics"""
-        location_lower = location.lower()
-        position_lower = position.lower() if position else ""
-        
-        # Determine species category
-        if 'lightpole' in location_lower or 'light pole' in location_lower or 'pole' in location_lower:
-            if 'flag' in location_lower or 'flag' in position_lower:
-                return 'LightPolaflag'
-            return SPECIES_NAMES['lightpole'][0]
-        elif 'vehicle' in location_lower or 'van' in location_lower or 'car' in location_lower or 'truck' in location_lower:
-            return SPECIES_NAMES['vehicle'][0]
-        elif 'building' in location_lower or 'roof' in location_lower or 'wall' in location_lower:
-            return SPECIES_NAMES['building'][0]
-        elif 'utility' in location_lower or 'box' in location_lower or 'cabinet' in location_lower:
-            return SPECIES_NAMES['utility'][0]
-        elif 'backpack' in location_lower or 'portable' in location_lower:
-            return SPECIES_NAMES['portable'][0]
-        elif 'ground' in position_lower or 'floor' in position_lower:
-            return SPECIES_NAMES['ground'][0]
-        else:
-            return SPECIES_NAMES['unknown'][0]
-    
+        return _species_for(location, device_type, position)
+
     def catch_stingray(self, location, position, signal_strength, device_type='unknown', nickname=None, photo_path=None):
         """Register a new Stingray catch!"""
-        catch_id = len(self.catches['catches']) + 1
-        
+        cur = self.conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM catches')
+        catch_id = cur.fetchone()[0]
+
+        species = self.generate_species_name(location, device_type, position)
+
         # Auto-generate species name if no nickname provided
         if not nickname:
-            species = self.generate_species_name(location, device_type, position)
             nickname = f"{species} #{catch_id}"
-        
+
         # Handle photo
-        photo_filename = None
-        if photo_path and os.path.exists(photo_path):
-            ext = os.path.splitext(photo_path)[1]
-            photo_filename = f"stingray_{catch_id}{ext}"
-            dest = os.path.join(PHOTO_DIR, photo_filename)
-            shutil.copy2(photo_path, dest)
-        
-        catch = {
-            'id': catch_id,
-            'nickname': nickname,
-            'species': self.generate_species_name(location, device_type, position),
-            'caught_date': datetime.now().isoformat(),
-            'location': location,
-            'position': position,
-            'signal_strength': signal_strength,
-            'device_type': device_type,
-            'photo': photo_filename,
-            'frequencies': [],
-            'sightings': 1,
-            'last_seen': datetime.now().isoformat(),
-            'status': 'active'
-        }
-        
-        self.catches['catches'].append(catch)
-        self.catches['stats']['total'] += 1
-        if device_type == 'mobile':
-            self.catches['stats']['mobile'] += 1
-        elif device_type == 'fixed':
-            self.catches['stats']['fixed'] += 1
-        
-        self.save_catches()
+        photo_filename = store_photo(photo_path) if photo_path else None
+
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute('''
+                INSERT INTO catches(id, nickname, species, caught_date, location,
+                    position, signal_strength, device_type, photo, frequencies,
+                    sightings, last_seen, status)
+                VALUES(?,?,?,?,?,?,?,?,?,'[]',1,?,'active')
+            ''', (catch_id, nickname, species, now, location, position,
+                  signal_strength, device_type, photo_filename, now))
+            self.conn.execute(
+                "UPDATE stats SET value = value + 1 WHERE key = 'total'")
+            if device_type in ('mobile', 'fixed'):
+                self.conn.execute(
+                    'UPDATE stats SET value = value + 1 WHERE key = ?',
+                    (device_type,))
         return catch_id
-    
+
+    def catch_many(self, rows):
+        """Register a whole batch of catches in one transaction
+
+        Each row is a dict with the same fields the catch command takes:
+        location, position, signal_strength and optional device_type,
+        nickname, photo. The batch commits once, so N catches cost one
+        fsync instead of N. Returns the new catch ids.
+        """
+        cur = self.conn.execute('SELECT COALESCE(MAX(id), 0) FROM catches')
+        next_id = cur.fetchone()[0] + 1
+
+        # Copy photos and build the rows up front so file I/O never
+        # interleaves with the database writes
+        now = datetime.now().isoformat()
+        inserts = []
+        counts = {'total': 0, 'mobile': 0, 'fixed': 0}
+        for offset, row in enumerate(rows):
+            catch_id = next_id + offset
+            location = row['location']
+            position = row.get('position', '')
+            device_type = row.get('device_type', 'unknown')
+            species = self.generate_species_name(location, device_type, position)
+            nickname = row.get('nickname') or f"{species} #{catch_id}"
+
+            photo_path = row.get('photo')
+            photo_filename = store_photo(photo_path) if photo_path else None
+
+            counts['total'] += 1
+            if device_type in ('mobile', 'fixed'):
+                counts[device_type] += 1
+            inserts.append((catch_id, nickname, species, now, location, position,
+                            row.get('signal_strength'), device_type,
+                            photo_filename, now))
+
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO catches(id, nickname, species, caught_date, location,
+                    position, signal_strength, device_type, photo, frequencies,
+                    sightings, last_seen, status)
+                VALUES(?,?,?,?,?,?,?,?,?,'[]',1,?,'active')
+            ''', inserts)
+            for key, count in counts.items():
+                if count:
+                    self.conn.execute(
+                        'UPDATE stats SET value = value + ? WHERE key = ?',
+                        (count, key))
+        return [insert[0] for insert in inserts]
+
     def update_sighting(self, catch_id, signal_strength=None):
         """Update an existing Stingray sighting"""
-        for catch in self.catches['catches']:
-            if catch['id'] == catch_id:
-                catch['sightings'] += 1
-                catch['last_seen'] = datetime.now().isoformat()
-                if signal_strength:
-                    catch['signal_strength'] = signal_strength
-                self.save_catches()
-                return True
-        return False
-    
+        with self.conn:
+            cur = self.conn.execute('''
+                UPDATE catches
+                SET sightings = sightings + 1,
+                    last_seen = ?,
+                    signal_strength = COALESCE(?, signal_strength)
+                WHERE id = ?
+            ''', (datetime.now().isoformat(), signal_strength, catch_id))
+        return cur.rowcount > 0
+
     def mark_gone(self, catch_id):
         """Mark a Stingray as no longer detected"""
-        for catch in self.catches['catches']:
-            if catch['id'] == catch_id:
-                catch['status'] = 'gone'
-                self.save_catches()
-                return True
-        return False
-    
+        with self.conn:
+            cur = self.conn.execute(
+                "UPDATE catches SET status = 'gone' WHERE id = ?", (catch_id,))
+        return cur.rowcount > 0
+
     def get_stats(self):
         """Get collection statistics"""
-        return self.catches['stats']
-    
+        return {row['key']: row['value']
+                for row in self.conn.execute('SELECT key, value FROM stats')}
+
     def list_catches(self, status='active'):
         """List all catches"""
-        return [c for c in self.catches['catches'] if c['status'] == status]
-    
+        return [self.row_to_catch(row) for row in self.conn.execute(
+            'SELECT * FROM catches WHERE status = ? ORDER BY id', (status,))]
+
     def get_catch(self, catch_id):
         """Get specific catch details"""
-        for catch in self.catches['catches']:
-            if catch['id'] == catch_id:
-                return catch
-        return None
-    
+        row = self.conn.execute(
+            'SELECT * FROM catches WHERE id = ?', (catch_id,)).fetchone()
+        return self.row_to_catch(row) if row else None
+
     def print_pokedex(self):
         """Print Stingray Pokedex!"""
-        print("\n" + "="*60)
-        print("🎯 STINGRAY POKEDEX 🎯")
-        print("="*60)
-        
+        # Build the whole report in one buffer; a single write replaces a
+        # print syscall per line
+        out = []
+        out.append("\n" + "="*60)
+        out.append("🎯 STINGRAY POKEDEX 🎯")
+        out.append("="*60)
+
         stats = self.get_stats()
-        print(f"\n📊 Collection Stats:")
-        print(f"   Total Caught: {stats['total']}")
-        print(f"   Mobile: {stats['mobile']}")
-        print(f"   Fixed: {stats['fixed']}")
-        
-        active = self.list_catches('active')
-        gone = self.list_catches('gone')
-        
-        print(f"\n   Currently Active: {len(active)}")
-        print(f"   No Longer Detected: {len(gone)}")
-        
+        out.append(f"\n📊 Collection Stats:")
+        out.append(f"   Total Caught: {stats['total']}")
+        out.append(f"   Mobile: {stats['mobile']}")
+        out.append(f"   Fixed: {stats['fixed']}")
+
+        # One query feeds both sections instead of a scan per status
+        active, gone = [], []
+        for row in self.conn.execute('SELECT * FROM catches ORDER BY id'):
+            catch = self.row_to_catch(row)
+            if catch['status'] == 'active':
+                active.append(catch)
+            elif catch['status'] == 'gone':
+                gone.append(catch)
+
+        out.append(f"\n   Currently Active: {len(active)}")
+        out.append(f"   No Longer Detected: {len(gone)}")
+
         if active:
-            print("\n🔴 ACTIVE STINGRAYS:")
+            out.append("\n🔴 ACTIVE STINGRAYS:")
             for catch in active:
-                print(f"\n   #{catch['id']}: {catch['nickname']}")
-                print(f"   Species: {catch.get('species', 'Unknown')}")
-                print(f"   Type: {catch['device_type'].upper()}")
-                print(f"   Location: {catch['location']}")
-                print(f"   Signal: {catch['signal_strength']} dBm")
-                print(f"   Sightings: {catch['sightings']}")
-                if catch.get('photo'):
-                    photo_path = os.path.join(PHOTO_DIR, catch['photo'])
-                    print(f"   📸 Photo: {photo_path}")
-                print(f"   First Seen: {catch['caught_date'][:10]}")
-                print(f"   Last Seen: {catch['last_seen'][:10]}")
-        
+                catch['species'] = catch.get('species') or 'Unknown'
+                catch['device_type_upper'] = catch['device_type'].upper()
+                catch['photo_line'] = (
+                    f"\n   📸 Photo: {os.path.join(PHOTO_DIR, catch['photo'])}"
+                    if catch.get('photo') else "")
+                catch['first_seen'] = catch['caught_date'][:10]
+                catch['last_seen_short'] = catch['last_seen'][:10]
+                out.append(_CATCH_TMPL.format_map(catch))
+
         if gone:
-            print("\n⚫ PREVIOUSLY DETECTED:")
+            out.append("\n⚫ PREVIOUSLY DETECTED:")
             for catch in gone:
-                print(f"   #{catch['id']}: {catch['nickname']} - Last seen {catch['last_seen'][:10]}")
-        
-        print("\n" + "="*60)
+                out.append(f"   #{catch['id']}: {catch['nickname']} - Last seen {catch['last_seen'][:10]}")
+
+        out.append("\n" + "="*60)
+        sys.stdout.write("\n".join(out) + "\n")
+
+def do_catch(tracker, args):
+    # ./stingray_map.py catch "lightpole with flags" "10ft north, 5ft west, 12ft high" -15.5 fixed --photo /path/to/photo.jpg
+    catch_id = tracker.catch_stingray(args.location, args.position,
+                                      args.signal_strength, args.device_type,
+                                      args.nickname, args.photo_path)
+    catch = tracker.get_catch(catch_id)
+
+    print(f"\n🎉 NEW STINGRAY CAUGHT! 🎉")
+    print(f"   ID: #{catch_id}")
+    print(f"   Species: {catch['species']}")
+    print(f"   Nickname: {catch['nickname']}")
+    print(f"   Type: {args.device_type.upper()}")
+    print(f"   Signal: {args.signal_strength} dBm")
+    if args.photo_path:
+        print(f"   📸 Photo saved!")
+    print(f"\n   Added to your Pokedex!")
+
+def do_catch_batch(tracker, args):
+    # ./stingray_map.py catch-batch catches.json
+    with open(args.path, 'r') as f:
+        rows = json.load(f)
+
+    ids = tracker.catch_many(rows)
+    print(f"\n🎉 Caught {len(ids)} Stingrays in one batch!")
+    if ids:
+        print(f"   IDs: #{ids[0]} - #{ids[-1]}")
+    print(f"\n   Added to your Pokedex!")
+
+def do_seen(tracker, args):
+    # ./stingray_map.py seen 1 -12.3
+    if tracker.update_sighting(args.id, args.signal_strength):
+        catch = tracker.get_catch(args.id)
+        print(f"\n✅ Updated sighting for: {catch['nickname']}")
+        print(f"   Total sightings: {catch['sightings']}")
+    else:
+        print(f"\n❌ Stingray #{args.id} not found")
+
+def do_gone(tracker, args):
+    # ./stingray_map.py gone 1
+    if tracker.mark_gone(args.id):
+        catch = tracker.get_catch(args.id)
+        print(f"\n👋 Marked as gone: {catch['nickname']}")
+        print(f"   It may have moved or been removed")
+    else:
+        print(f"\n❌ Stingray #{args.id} not found")
+
+def do_list(tracker, args):
+    tracker.print_pokedex()
+
+def do_stats(tracker, args):
+    stats = tracker.get_stats()
+    print(f"\n📊 Your Stingray Collection:")
+    print(f"   Total Caught: {stats['total']}")
+    print(f"   Mobile Units: {stats['mobile']}")
+    print(f"   Fixed Installations: {stats['fixed']}")
+    print(f"   Active Now: {len(tracker.list_catches('active'))}")
+
+# Hash dispatch instead of an elif chain per command
+COMMANDS = {
+    'catch': do_catch,
+    'catch-batch': do_catch_batch,
+    'seen': do_seen,
+    'gone': do_gone,
+    'list': do_list,
+    'stats': do_stats,
+}
+
+def build_parser():
+    """Declare the CLI; argparse replaces the hand-rolled sys.argv walk"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Track and visualize all detected Stingrays')
+    sub = parser.add_subparsers(dest='cmd')
+
+    catch = sub.add_parser(
+        'catch', help='Register a new Stingray',
+        epilog="Example: stingray_map.py catch 'lightpole with flags' "
+               "'12ft SW, 10ft high' -15.5 fixed --photo ~/photo.jpg")
+    catch.add_argument('location')
+    catch.add_argument('position')
+    catch.add_argument('signal_strength', type=float)
+    catch.add_argument('device_type', nargs='?', default='unknown')
+    catch.add_argument('--photo', dest='photo_path')
+    catch.add_argument('--name', dest='nickname')
+
+    batch = sub.add_parser(
+        'catch-batch', help='Register many Stingrays from a JSON file')
+    batch.add_argument('path', help='JSON list of objects with location, '
+                                    'position, signal_strength and optional '
+                                    'device_type, nickname, photo')
+
+    seen = sub.add_parser('seen', help='Update existing Stingray sighting')
+    seen.add_argument('id', type=int)
+    seen.add_argument('signal_strength', type=float, nargs='?')
+
+    gone = sub.add_parser('gone', help='Mark Stingray as no longer detected')
+    gone.add_argument('id', type=int)
+
+    sub.add_parser('list', help='Show your Pokedex')
+    sub.add_parser('stats', help='Show collection statistics')
+
+    return parser
 
 def main():
     """CLI for Stingray tracking"""
-    import sys
-    
+    args = build_parser().parse_args()
+
     tracker = StingrayTracker()
-    
-    if len(sys.argv) < 2:
+
+    if args.cmd is None:
         tracker.print_pokedex()
         return
-    
-    command = sys.argv[1]
-    
-    if command == 'catch':
-        # ./stingray_map.py catch "lightpole with flags" "10ft north, 5ft west, 12ft high" -15.5 fixed --photo /path/to/photo.jpg
-        if len(sys.argv) < 5:
-            print("Usage: stingray_map.py catch <location> <position> <signal_strength> [type] [--photo path] [--name nickname]")
-            print("\nExamples:")
-            print("  stingray_map.py catch 'lightpole with flags' '12ft SW, 10ft high' -15.5 fixed --photo ~/photo.jpg")
-            print("  stingray_map.py catch 'white van on street' '20ft north' -12.3 mobile --name 'Creepy Van'")
-            return
-        
-        location = sys.argv[2]
-        position = sys.argv[3]
-        signal_strength = float(sys.argv[4])
-        device_type = sys.argv[5] if len(sys.argv) > 5 and not sys.argv[5].startswith('--') else 'unknown'
-        
-        # Parse optional arguments
-        photo_path = None
-        nickname = None
-        
-        i = 6 if device_type != 'unknown' else 5
-        while i < len(sys.argv):
-            if sys.argv[i] == '--photo' and i + 1 < len(sys.argv):
-                photo_path = sys.argv[i + 1]
-                i += 2
-            elif sys.argv[i] == '--name' and i + 1 < len(sys.argv):
-                nickname = sys.argv[i + 1]
-                i += 2
-            else:
-                i += 1
-        
-        catch_id = tracker.catch_stingray(location, position, signal_strength, device_type, nickname, photo_path)
-        catch = tracker.get_catch(catch_id)
-        
-        print(f"\n🎉 NEW STINGRAY CAUGHT! 🎉")
-        print(f"   ID: #{catch_id}")
-        print(f"   Species: {catch['species']}")
-        print(f"   Nickname: {catch['nickname']}")
-        print(f"   Type: {device_type.upper()}")
-        print(f"   Signal: {signal_strength} dBm")
-        if photo_path:
-            print(f"   📸 Photo saved!")
-        print(f"\n   Added to your Pokedex!")
-        
-    elif command == 'seen':
-        # ./stingray_map.py seen 1 -12.3
-        if len(sys.argv) < 3:
-            print("Usage: stingray_map.py seen <id> [signal_strength]")
-            return
-        
-        catch_id = int(sys.argv[2])
-        signal_strength = float(sys.argv[3]) if len(sys.argv) > 3 else None
-        
-        if tracker.update_sighting(catch_id, signal_strength):
-            catch = tracker.get_catch(catch_id)
-            print(f"\n✅ Updated sighting for: {catch['nickname']}")
-            print(f"   Total sightings: {catch['sightings']}")
-        else:
-            print(f"\n❌ Stingray #{catch_id} not found")
-    
-    elif command == 'gone':
-        # ./stingray_map.py gone 1
-        if len(sys.argv) < 3:
-            print("Usage: stingray_map.py gone <id>")
-            return
-        
-        catch_id = int(sys.argv[2])
-        
-        if tracker.mark_gone(catch_id):
-            catch = tracker.get_catch(catch_id)
-            print(f"\n👋 Marked as gone: {catch['nickname']}")
-            print(f"   It may have moved or been removed")
-        else:
-            print(f"\n❌ Stingray #{catch_id} not found")
-    
-    elif command == 'list':
-        tracker.print_pokedex()
-    
-    elif command == 'stats':
-        stats = tracker.get_stats()
-        print(f"\n📊 Your Stingray Collection:")
-        print(f"   Total Caught: {stats['total']}")
-        print(f"   Mobile Units: {stats['mobile']}")
-        print(f"   Fixed Installations: {stats['fixed']}")
-        print(f"   Active Now: {len(tracker.list_catches('active'))}")
-    
-    else:
-        print("Commands:")
-        print("  list   - Show your Pokedex")
-        print("  catch  - Register a new Stingray")
-        print("  seen   - Update existing Stingray sighting")
-        print("  gone   - Mark Stingray as no longer detected")
-        print("  stats  - Show collection statistics")
+
+    COMMANDS[args.cmd](tracker, args)
 
 if __name__ == '__main__':
     main()